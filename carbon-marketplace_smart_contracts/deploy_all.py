@@ -34,6 +34,20 @@ if balance < 1:
     exit()
 
 
+# ── Helper: refuse stale build artifacts ──────────────────────
+def require_artifacts(arc56_path, method_names, event_names):
+    with open(arc56_path) as f:
+        spec = json.load(f)
+    methods = {m["name"] for m in spec.get("methods", [])}
+    events  = {e["name"] for e in spec.get("events", [])}
+    missing = [name for name in method_names if name not in methods]
+    missing += [f"event {name}" for name in event_names if name not in events]
+    if missing:
+        print(f"{arc56_path} is out of date (no {', '.join(missing)}).")
+        print("Rebuild the contracts with `algokit project run build` and retry.")
+        exit(1)
+
+
 # ── Helper: compile TEAL ───────────────────────────────────────
 def compile_teal(path):
     with open(path) as f:
@@ -41,12 +55,29 @@ def compile_teal(path):
     return base64.b64decode(result["result"])
 
 
+# ── Helper: extra program pages ───────────────────────────────
+# A page is 2048 bytes shared by the approval and clear programs; apps
+# can have at most 3 extra pages.
+PAGE_SIZE       = 2048
+MAX_EXTRA_PAGES = 3
+
+def extra_pages(name, approval, clear):
+    size  = len(approval) + len(clear)
+    pages = (size - 1) // PAGE_SIZE
+    if pages > MAX_EXTRA_PAGES:
+        print(f"{name} compiles to {size} bytes, over the {(MAX_EXTRA_PAGES + 1) * PAGE_SIZE}-byte program limit.")
+        exit(1)
+    print(f"    Program  : {size} bytes, {pages} extra page(s)")
+    return pages
+
+
 # ── Helper: deploy one contract via ABI ───────────────────────
 def deploy(name, approval_path, clear_path, arc56_path, global_schema, local_schema, method_name, method_args):
     print(f"Deploying {name}...")
 
     approval = compile_teal(approval_path)
     clear    = compile_teal(clear_path)
+    pages    = extra_pages(name, approval, clear)
 
     # Load ABI from arc56 json
     with open(arc56_path) as f:
@@ -72,7 +103,7 @@ def deploy(name, approval_path, clear_path, arc56_path, global_schema, local_sch
         clear_program     = clear,
         global_schema     = global_schema,
         local_schema      = local_schema,
-        extra_pages       = 1,
+        extra_pages       = pages,
     )
 
     # Use AtomicTransactionComposer for ABI method call
@@ -89,7 +120,7 @@ def deploy(name, approval_path, clear_path, arc56_path, global_schema, local_sch
         clear_program   = clear,
         global_schema   = global_schema,
         local_schema    = local_schema,
-        extra_pages     = 1,
+        extra_pages     = pages,
     )
 
     result  = atc.execute(client, 4)
@@ -106,6 +137,45 @@ def deploy(name, approval_path, clear_path, arc56_path, global_schema, local_sch
     return app_id
 
 
+# ── Helper: call an ABI method on a deployed app ──────────────
+def call(app_id, arc56_path, method_name, method_args):
+    with open(arc56_path) as f:
+        arc56 = json.load(f)
+
+    abi_contract = abi.Contract.from_json(json.dumps({
+        "name": arc56.get("name", ""),
+        "methods": arc56.get("methods", []),
+    }))
+
+    atc = AtomicTransactionComposer()
+    atc.add_method_call(
+        app_id      = app_id,
+        method      = abi_contract.get_method_by_name(method_name),
+        sender      = address,
+        sp          = client.suggested_params(),
+        signer      = signer,
+        method_args = method_args,
+    )
+    return atc.execute(client, 4)
+
+
+# ── Check the artifacts match the contracts ───────────────────
+require_artifacts(
+    "smart_contracts/credit_issuance/CreditIssuanceRegistry.arc56.json",
+    ["create_registry", "get_credit_terms", "sync_supply"],
+    ["Minted", "CreditClaimed", "SupplySynced"],
+)
+require_artifacts(
+    "smart_contracts/marketplace/CarbonMarketplace.arc56.json",
+    ["create_marketplace", "set_issuance_registry", "set_retirement_registry", "get_deposits"],
+    ["Listed", "Sold", "BidFilled"],
+)
+require_artifacts(
+    "smart_contracts/retirement/RetirementRegistry.arc56.json",
+    ["create_registry", "set_issuance_registry", "retire_deposit", "get_retirement_mbr"],
+    ["Retired", "BatchRetired"],
+)
+
 # ── Deploy Contract 1: CreditIssuanceRegistry ─────────────────
 id1 = deploy(
     name          = "CreditIssuanceRegistry",
@@ -113,7 +183,7 @@ id1 = deploy(
     clear_path    = "smart_contracts/credit_issuance/CreditIssuanceRegistry.clear.teal",
     arc56_path    = "smart_contracts/credit_issuance/CreditIssuanceRegistry.arc56.json",
     global_schema = transaction.StateSchema(num_uints=2, num_byte_slices=1),
-    local_schema  = transaction.StateSchema(num_uints=2, num_byte_slices=2),
+    local_schema  = transaction.StateSchema(num_uints=0, num_byte_slices=0),
     method_name   = "create_registry",
     method_args   = [],
 )
@@ -124,24 +194,53 @@ id2 = deploy(
     approval_path = "smart_contracts/marketplace/CarbonMarketplace.approval.teal",
     clear_path    = "smart_contracts/marketplace/CarbonMarketplace.clear.teal",
     arc56_path    = "smart_contracts/marketplace/CarbonMarketplace.arc56.json",
-    global_schema = transaction.StateSchema(num_uints=4, num_byte_slices=1),
+    global_schema = transaction.StateSchema(num_uints=8, num_byte_slices=1),
     local_schema  = transaction.StateSchema(num_uints=0, num_byte_slices=0),
     method_name   = "create_marketplace",
     method_args   = [250],   # 250 bps = 2.5% fee
 )
 
+# Listings read credit expiry and CO2 per unit from the issuance registry
+call(
+    app_id      = id2,
+    arc56_path  = "smart_contracts/marketplace/CarbonMarketplace.arc56.json",
+    method_name = "set_issuance_registry",
+    method_args = [id1],
+)
+print(f"    Issuance registry set to {id1}")
+print()
+
 # ── Deploy Contract 3: RetirementRegistry ─────────────────────
 id3 = deploy(
     name          = "RetirementRegistry",
     approval_path = "smart_contracts/retirement/RetirementRegistry.approval.teal",
     clear_path    = "smart_contracts/retirement/RetirementRegistry.clear.teal",
     arc56_path    = "smart_contracts/retirement/RetirementRegistry.arc56.json",
-    global_schema = transaction.StateSchema(num_uints=3, num_byte_slices=1),
+    global_schema = transaction.StateSchema(num_uints=5, num_byte_slices=2),
     local_schema  = transaction.StateSchema(num_uints=0, num_byte_slices=0),
     method_name   = "create_registry",
     method_args   = [],
 )
 
+# Retirements read CO2 per unit from the issuance registry
+call(
+    app_id      = id3,
+    arc56_path  = "smart_contracts/retirement/RetirementRegistry.arc56.json",
+    method_name = "set_issuance_registry",
+    method_args = [id1],
+)
+print(f"    Issuance registry set to {id1}")
+
+# buy_and_retire() deposits into the retirement registry
+call(
+    app_id      = id2,
+    arc56_path  = "smart_contracts/marketplace/CarbonMarketplace.arc56.json",
+    method_name = "set_retirement_registry",
+    method_args = [id3],
+)
+print(f"    Marketplace retirement registry set to {id3}")
+print()
+
 # ── Save App IDs ───────────────────────────────────────────────
 with open("app_ids.txt", "w") as f:
     f.write(f"CreditIssuanceRegistry : {id1}\n")
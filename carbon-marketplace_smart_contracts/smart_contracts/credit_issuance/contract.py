@@ -2,7 +2,6 @@ from algopy import (
     ARC4Contract,
     Asset,
     GlobalState,
-    LocalState,
     UInt64,
     Bytes,
     Account,
@@ -11,9 +10,150 @@ from algopy import (
     arc4,
     itxn,
     op,
+    gtxn,
+    subroutine,
+    urange,
 )
 
 
+# Asset-keyed copy of each credit's metadata box: prefix | asset_id(8).
+# Project boxes are keyed by the ARC-4 encoded project ID, whose 2-byte
+# length prefix ("as" would be 24,947 bytes) can never match, so the
+# keys never collide.
+# It extends the 40-byte project metadata with the credit's supply and
+# market: total_units(8) | remaining_units(8) | claimed_at(8) | market_id(8),
+# market_id being the first 8 bytes of sha256 of the ARC-4 encoded
+# project type, the key CarbonMarketplace files listings and bids under.
+ASSET_PREFIX           = b"asset:"
+ASSET_TOTAL_OFFSET     = 40
+ASSET_REMAINING_OFFSET = 48
+ASSET_CLAIMED_OFFSET   = 56
+ASSET_MARKET_OFFSET    = 64
+
+# Issuer registry: prefix | account(32) → Issuer. Disjoint from project
+# keys like ASSET_PREFIX.
+# status is the first byte so it can be read without decoding the record.
+ISSUER_PREFIX         = b"issuer:"
+ISSUER_CREDITS_OFFSET = 1
+MAX_ISSUER_FIELD      = 64
+
+# Issuer status
+ISSUER_PENDING  = 0
+ISSUER_VERIFIED = 1
+
+# Box minimum balance: flat + per byte of key and value. Registrations pay
+# it up front and get it back when they deregister.
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+
+# Addresses per verify_issuers() call; each needs its issuer box referenced.
+# One 36-byte IssuerVerified log each keeps the call under the 32-log and
+# 1 KB log limits.
+MAX_VERIFY_BATCH = 24
+
+# Expiry is Jan 1 of (vintage_year + years_valid), with 365-day years from 2000
+SECONDS_PER_YEAR = 31_536_000
+BASE_2000_UNIX   = 946_684_800
+
+# Credit terms report CO2 per ASA base unit in kilograms, exact for NFTs
+# and for tranches of either decimals setting (1000 kg or 1 kg per unit)
+KG_PER_TONNE = 1000
+
+# Credits per mint_carbon_credits() call: one inner AssetConfig and one
+# Minted log (81 bytes + project ID) each, so with project IDs of at most
+# MAX_PROJECT_ID bytes the logs and the returned IDs stay under 1 KB
+MAX_MINT_BATCH = 8
+MAX_PROJECT_ID = 32
+
+# Keys per bulk lookup, so the result fits one 1 KB ABI return
+MAX_BULK_LOOKUP = 24
+
+
+class Issuer(arc4.Struct):
+    """Issuer registry record, boxed under ISSUER_PREFIX | account."""
+    status:         arc4.UInt8
+    credits_issued: arc4.UInt64
+    name:           arc4.String
+    standard:       arc4.String
+
+
+# ─────────────────────────────────────────
+#  ARC-28 EVENTS
+# ─────────────────────────────────────────
+
+class IssuerRegistered(arc4.Struct):
+    """ARC-28 event: an NGO registered (status pending)."""
+    issuer:   arc4.Address
+    name:     arc4.String
+    standard: arc4.String
+
+
+class IssuerDeregistered(arc4.Struct):
+    """ARC-28 event: an NGO deleted its registration and took back its MBR."""
+    issuer: arc4.Address
+
+
+class IssuerVerified(arc4.Struct):
+    """ARC-28 event emitted each time an issuer is verified."""
+    issuer: arc4.Address
+
+
+class Minted(arc4.Struct):
+    """ARC-28 event: a credit NFT or tranche was minted."""
+    asset_id:     arc4.UInt64
+    issuer:       arc4.Address
+    project_id:   arc4.String
+    co2_tonnes:   arc4.UInt64
+    vintage_year: arc4.UInt64
+    expiry:       arc4.UInt64
+    units:        arc4.UInt64
+    decimals:     arc4.UInt8
+
+
+class CreditClaimed(arc4.Struct):
+    """ARC-28 event: the issuer collected a credit's minted units."""
+    asset_id: arc4.UInt64
+    issuer:   arc4.Address
+    units:    arc4.UInt64
+
+
+class SupplySynced(arc4.Struct):
+    """ARC-28 event: sync_supply() recomputed a credit's remaining supply."""
+    asset_id:        arc4.UInt64
+    remaining_units: arc4.UInt64
+
+
+class CreditStatus(arc4.Struct):
+    """One entry of get_credit_expiries(); found=False if the project is unknown."""
+    found:    arc4.Bool
+    expired:  arc4.Bool
+    asset_id: arc4.UInt64
+    expiry:   arc4.UInt64
+
+
+class CreditInfo(arc4.Struct):
+    """One entry of get_credits_by_asset(); found=False if the asset is not indexed."""
+    found:           arc4.Bool
+    expired:         arc4.Bool
+    co2_tonnes:      arc4.UInt64
+    vintage_year:    arc4.UInt64
+    mint_time:       arc4.UInt64
+    expiry:          arc4.UInt64
+    remaining_units: arc4.UInt64
+
+
+class CreditSpec(arc4.Struct):
+    """One credit to mint via mint_carbon_credits(); fields as in mint_carbon_credit()."""
+    project_id:   arc4.String
+    project_name: arc4.String
+    location:     arc4.String
+    co2_tonnes:   arc4.UInt64
+    vintage_year: arc4.UInt64
+    project_type: arc4.String
+    ipfs_hash:    arc4.String
+    years_valid:  arc4.UInt64
+
+
 class CreditIssuanceRegistry(ARC4Contract):
     """
     Contract 1 — Credit Issuance Registry (with Expiry Dates)
@@ -29,11 +169,6 @@ class CreditIssuanceRegistry(ARC4Contract):
         self.admin                = GlobalState(Account)
         self.total_credits_issued = GlobalState(UInt64)
 
-        self.issuer_verified      = LocalState(UInt64)
-        self.issuer_credits       = LocalState(UInt64)
-        self.issuer_name          = LocalState(Bytes)
-        self.issuer_standard      = LocalState(Bytes)
-
 
     # ─────────────────────────────────────────
     #  DEPLOY
@@ -57,18 +192,113 @@ class CreditIssuanceRegistry(ARC4Contract):
         country:               arc4.String,
         verification_standard: arc4.String,
     ) -> None:
-        """NGO registers. Starts as unverified until admin approves."""
-        self.issuer_name[Txn.sender]     = name.bytes
-        self.issuer_standard[Txn.sender] = verification_standard.bytes
-        self.issuer_verified[Txn.sender] = UInt64(0)
-        self.issuer_credits[Txn.sender]  = UInt64(0)
+        """
+        NGO registers. Starts as unverified until admin approves.
+
+        No opt-in needed: the record is a box (see Issuer). The NGO pays
+        its minimum balance, 2500 + 400 × (key + record bytes) microALGO,
+        and gets it back with deregister_issuer(). Reference box
+        ISSUER_PREFIX + sender.
+
+        Call as atomic group:
+            [0] Payment  — NGO pays the box MBR to contract
+            [1] AppCall  — this method
+        """
+        assert Txn.group_index > UInt64(0),                                    "Must be in atomic group"
+        assert name.bytes.length <= UInt64(MAX_ISSUER_FIELD),                  "Name too long"
+        assert verification_standard.bytes.length <= UInt64(MAX_ISSUER_FIELD), "Standard too long"
+
+        key = ISSUER_PREFIX + Txn.sender.bytes
+        _size, registered = op.Box.length(key)
+        assert not registered, "Already registered"
+
+        record = Issuer(
+            status         = arc4.UInt8(ISSUER_PENDING),
+            credits_issued = arc4.UInt64(0),
+            name           = name,
+            standard       = verification_standard,
+        ).bytes
+
+        pay = gtxn.PaymentTransaction(Txn.group_index - UInt64(1))
+        assert pay.sender   == Txn.sender,                                  "Payment sender mismatch"
+        assert pay.receiver == Global.current_application_address,          "Wrong receiver"
+        assert pay.amount   == self._box_mbr(key.length + record.length),   "Wrong MBR payment"
+
+        op.Box.put(key, record)
+        arc4.emit(IssuerRegistered(arc4.Address(Txn.sender), name, verification_standard))
+
+
+    @arc4.abimethod
+    def deregister_issuer(self) -> None:
+        """
+        NGO deletes its registration and is refunded the box MBR it paid.
+        Credits it already minted are unaffected; registering again starts
+        pending. The refund's fee comes from this call: pay 2 × min fee.
+        """
+        key = ISSUER_PREFIX + Txn.sender.bytes
+        size, registered = op.Box.length(key)
+        assert registered, "Issuer not registered"
+
+        op.Box.delete(key)
+        itxn.Payment(
+            receiver = Txn.sender,
+            amount   = self._box_mbr(key.length + size),
+            fee      = 0,
+        ).submit()
+        arc4.emit(IssuerDeregistered(arc4.Address(Txn.sender)))
+
+
+    @subroutine
+    def _box_mbr(self, size: UInt64) -> UInt64:
+        """Minimum balance of a box with key and value totalling size bytes."""
+        return UInt64(BOX_FLAT_MIN_BALANCE) + UInt64(BOX_BYTE_MIN_BALANCE) * size
 
 
     @arc4.abimethod
     def verify_issuer(self, issuer: arc4.Address) -> None:
         """Admin approves an NGO."""
         assert Txn.sender == self.admin.value, "Admin only"
-        self.issuer_verified[issuer.native] = UInt64(1)
+        self._verify_issuer(issuer)
+
+
+    @arc4.abimethod
+    def verify_issuers(self, issuers: arc4.DynamicArray[arc4.Address]) -> None:
+        """
+        Admin approves a queue of NGOs in one call, emitting one
+        IssuerVerified event per issuer. Up to MAX_VERIFY_BATCH addresses;
+        every issuer box must be referenced somewhere in the group.
+        """
+        assert Txn.sender == self.admin.value,                 "Admin only"
+        assert issuers.length <= UInt64(MAX_VERIFY_BATCH),     "Too many issuers in one call"
+
+        for issuer in issuers:
+            self._verify_issuer(issuer)
+
+
+    @subroutine
+    def _verify_issuer(self, issuer: arc4.Address) -> None:
+        key = ISSUER_PREFIX + issuer.bytes
+        _size, registered = op.Box.length(key)
+        assert registered, "Issuer not registered"
+        op.Box.replace(key, 0, arc4.UInt8(ISSUER_VERIFIED).bytes)
+        arc4.emit(IssuerVerified(issuer))
+
+
+    @subroutine
+    def _issuer_status(self, issuer: Account) -> UInt64:
+        """Status byte of an issuer's record; ISSUER_PENDING if unregistered."""
+        key = ISSUER_PREFIX + issuer.bytes
+        _size, registered = op.Box.length(key)
+        if not registered:
+            return UInt64(ISSUER_PENDING)
+        return op.btoi(op.Box.extract(key, 0, 1))
+
+
+    @subroutine
+    def _add_credits_issued(self, issuer: Account, count: UInt64) -> None:
+        key    = ISSUER_PREFIX + issuer.bytes
+        issued = op.btoi(op.Box.extract(key, ISSUER_CREDITS_OFFSET, 8))
+        op.Box.replace(key, ISSUER_CREDITS_OFFSET, op.itob(issued + count))
 
 
     # ─────────────────────────────────────────
@@ -97,36 +327,173 @@ class CreditIssuanceRegistry(ARC4Contract):
           vintage_year = 2024, years_valid = 5
           → credit expires on Jan 1, 2029 (Unix: 1861920000)
 
+        The NFT stays with the registry until the issuer collects it
+        with claim_credit().
+
+        project_type is recorded as the credit's market (see
+        get_credit_terms), which CarbonMarketplace lists it and matches
+        bids under; mint_credit_tranche() and mint_carbon_credits() do
+        the same.
+
         Returns: ASA ID of the new NFT
         """
-        assert self.issuer_verified[Txn.sender] == UInt64(1), "Issuer not verified"
-        assert co2_tonnes.native > UInt64(0),                  "Must represent CO2"
-        assert vintage_year.native >= UInt64(2000),            "Invalid vintage year"
-        assert years_valid.native >= UInt64(1),                "Min 1 year validity"
-        assert years_valid.native <= UInt64(10),               "Max 10 years validity"
+        assert self._issuer_status(Txn.sender) == UInt64(ISSUER_VERIFIED), "Issuer not verified"
+
+        asset_id = self._mint(
+            project_id.bytes,
+            project_name.bytes,
+            co2_tonnes.native,
+            vintage_year.native,
+            project_type.bytes,
+            ipfs_hash.bytes,
+            years_valid.native,
+            UInt64(1),
+            UInt64(0),
+        )
+
+        self._add_credits_issued(Txn.sender, UInt64(1))
+        self.total_credits_issued.value = self.total_credits_issued.value + UInt64(1)
+
+        return arc4.UInt64(asset_id)
+
+
+    @arc4.abimethod
+    def mint_credit_tranche(
+        self,
+        project_id:      arc4.String,
+        project_name:    arc4.String,
+        location:        arc4.String,
+        co2_tonnes:      arc4.UInt64,
+        vintage_year:    arc4.UInt64,
+        project_type:    arc4.String,
+        ipfs_hash:       arc4.String,
+        years_valid:     arc4.UInt64,
+        decimals:        arc4.UInt8,
+    ) -> arc4.UInt64:
+        """
+        Verified NGO mints a whole (project, vintage) tranche as one
+        fungible ASA instead of a single NFT.
+
+        decimals: 0 → one unit per tonne, 3 → one unit per kilogram
+        total supply = co2_tonnes × 10^decimals, so parts of the tranche
+        can be transferred, sold and retired independently.
+
+        Units stay with the registry until the issuer collects them with
+        claim_credit(). Retired units come back to the registry (the ASA
+        creator); sync_supply() updates the remaining supply from that.
+
+        Returns: ASA ID of the tranche
+        """
+        assert self._issuer_status(Txn.sender) == UInt64(ISSUER_VERIFIED),   "Issuer not verified"
+        assert decimals.native == UInt64(0) or decimals.native == UInt64(3), "Decimals must be 0 or 3"
+
+        asset_id = self._mint(
+            project_id.bytes,
+            project_name.bytes,
+            co2_tonnes.native,
+            vintage_year.native,
+            project_type.bytes,
+            ipfs_hash.bytes,
+            years_valid.native,
+            co2_tonnes.native * op.exp(UInt64(10), decimals.native),
+            decimals.native,
+        )
+
+        self._add_credits_issued(Txn.sender, UInt64(1))
+        self.total_credits_issued.value = self.total_credits_issued.value + UInt64(1)
+
+        return arc4.UInt64(asset_id)
+
+
+    @arc4.abimethod
+    def mint_carbon_credits(
+        self,
+        specs: arc4.DynamicArray[CreditSpec],
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Verified NGO mints many credits in one call.
+
+        Each spec is validated and minted exactly as mint_carbon_credit()
+        would; issuer and global counters are updated once at the end.
+        At most MAX_MINT_BATCH credits per call (one inner AssetConfig each),
+        with project IDs of at most MAX_PROJECT_ID bytes.
+
+        Every credit writes two boxes (project_id and b"asset:" + itob(asset_id)),
+        so larger batches need extra box references from other app calls
+        in the same group.
+
+        Returns: ASA IDs of the new NFTs, in spec order
+        """
+        assert self._issuer_status(Txn.sender) == UInt64(ISSUER_VERIFIED), "Issuer not verified"
+
+        count = specs.length
+        assert count > UInt64(0),               "No credits given"
+        assert count <= UInt64(MAX_MINT_BATCH), "Too many credits in one call"
+
+        asset_ids = arc4.DynamicArray[arc4.UInt64]()
+        for i in urange(count):
+            spec = specs[i].copy()
+            # project_id is ARC-4 encoded: 2-byte length, then the ID itself
+            assert spec.project_id.bytes.length <= UInt64(2 + MAX_PROJECT_ID), "Project ID too long"
+            asset_ids.append(arc4.UInt64(self._mint(
+                spec.project_id.bytes,
+                spec.project_name.bytes,
+                spec.co2_tonnes.native,
+                spec.vintage_year.native,
+                spec.project_type.bytes,
+                spec.ipfs_hash.bytes,
+                spec.years_valid.native,
+                UInt64(1),
+                UInt64(0),
+            )))
+
+        self._add_credits_issued(Txn.sender, count)
+        self.total_credits_issued.value = self.total_credits_issued.value + count
+
+        return asset_ids
+
+
+    @subroutine
+    def _mint(
+        self,
+        project_id:   Bytes,
+        project_name: Bytes,
+        co2_tonnes:   UInt64,
+        vintage_year: UInt64,
+        project_type: Bytes,
+        ipfs_hash:    Bytes,
+        years_valid:  UInt64,
+        units:        UInt64,
+        decimals:     UInt64,
+    ) -> UInt64:
+        """
+        Validates one credit, creates its ASA (units × 10^-decimals) and
+        writes its metadata boxes.
+        """
+        assert co2_tonnes > UInt64(0),                         "Must represent CO2"
+        assert vintage_year >= UInt64(2000),                   "Invalid vintage year"
+        assert years_valid >= UInt64(1),                       "Min 1 year validity"
+        assert years_valid <= UInt64(10),                      "Max 10 years validity"
 
         # Reject duplicate project IDs
-        box_value, box_exists = op.Box.get(project_id.bytes)
+        _size, box_exists = op.Box.length(project_id)
         assert not box_exists, "Project ID already exists"
 
         # Calculate expiry timestamp
         # Unix timestamp for Jan 1 of (vintage_year + years_valid)
         # 1 year ≈ 31,536,000 seconds
         # Base: Jan 1 2000 = 946684800
-        SECONDS_PER_YEAR = UInt64(31_536_000)
-        BASE_2000_UNIX   = UInt64(946_684_800)
+        years_since_2000  = vintage_year - UInt64(2000)
+        vintage_timestamp = UInt64(BASE_2000_UNIX) + (years_since_2000 * UInt64(SECONDS_PER_YEAR))
+        expiry_timestamp  = vintage_timestamp + (years_valid * UInt64(SECONDS_PER_YEAR))
 
-        years_since_2000  = vintage_year.native - UInt64(2000)
-        vintage_timestamp = BASE_2000_UNIX + (years_since_2000 * SECONDS_PER_YEAR)
-        expiry_timestamp  = vintage_timestamp + (years_valid.native * SECONDS_PER_YEAR)
-
-        # Create the NFT
+        # Create the NFT (or tranche)
         asset_txn = itxn.AssetConfig(
-            total          = 1,
-            decimals       = 0,
+            total          = units,
+            decimals       = decimals,
             unit_name      = b"CCT",
-            asset_name     = project_name.bytes,
-            url            = b"ipfs://" + ipfs_hash.bytes,
+            asset_name     = project_name,
+            url            = b"ipfs://" + ipfs_hash,
             manager        = Global.current_application_address,
             reserve        = Txn.sender,
             freeze         = Global.current_application_address,
@@ -140,19 +507,90 @@ class CreditIssuanceRegistry(ARC4Contract):
         # Store metadata in box
         # Layout: asset_id(8) | co2(8) | vintage(8) | mint_time(8) | expiry(8)
         # Total: 40 bytes
-        op.Box.put(
-            project_id.bytes,
+        metadata = (
             op.itob(asset_id)                 +   # offset 0  — 8 bytes
-            op.itob(co2_tonnes.native)         +   # offset 8  — 8 bytes
-            op.itob(vintage_year.native)       +   # offset 16 — 8 bytes
+            op.itob(co2_tonnes)                +   # offset 8  — 8 bytes
+            op.itob(vintage_year)              +   # offset 16 — 8 bytes
             op.itob(Global.latest_timestamp)   +   # offset 24 — 8 bytes (mint time)
-            op.itob(expiry_timestamp),             # offset 32 — 8 bytes (expiry ← NEW)
+            op.itob(expiry_timestamp)              # offset 32 — 8 bytes (expiry ← NEW)
         )
+        op.Box.put(project_id, metadata)
 
-        self.issuer_credits[Txn.sender]  = self.issuer_credits[Txn.sender] + UInt64(1)
-        self.total_credits_issued.value  = self.total_credits_issued.value  + UInt64(1)
+        # Same metadata keyed by asset ID, for lookups that only know the ASA,
+        # plus the supply (all units unretired and not yet claimed) and market
+        op.Box.put(
+            ASSET_PREFIX + op.itob(asset_id),
+            metadata + op.itob(units) + op.itob(units) + op.itob(0)
+            + op.extract(op.sha256(project_type), 0, 8),
+        )
+        arc4.emit(Minted(
+            asset_id     = arc4.UInt64(asset_id),
+            issuer       = arc4.Address(Txn.sender),
+            project_id   = arc4.String.from_bytes(project_id),
+            co2_tonnes   = arc4.UInt64(co2_tonnes),
+            vintage_year = arc4.UInt64(vintage_year),
+            expiry       = arc4.UInt64(expiry_timestamp),
+            units        = arc4.UInt64(units),
+            decimals     = arc4.UInt8(decimals),
+        ))
 
-        return arc4.UInt64(asset_id)
+        return asset_id
+
+
+    # ─────────────────────────────────────────
+    #  CLAIM & SUPPLY
+    # ─────────────────────────────────────────
+
+    @arc4.abimethod
+    def claim_credit(self, asset_id: arc4.UInt64) -> arc4.UInt64:
+        """
+        Issuer (the ASA's reserve address) collects the minted units from
+        the registry. Allowed once per credit; the issuer must be opted in.
+
+        Returns: units transferred
+        """
+        asset = Asset(asset_id.native)
+        key   = ASSET_PREFIX + op.itob(asset_id.native)
+        _size, indexed = op.Box.length(key)
+        assert indexed,                                                             "Credit not found"
+        assert Txn.sender == asset.reserve,                                         "Only the issuer can claim"
+        assert op.btoi(op.Box.extract(key, ASSET_CLAIMED_OFFSET, 8)) == UInt64(0), "Already claimed"
+
+        units = op.btoi(op.Box.extract(key, ASSET_TOTAL_OFFSET, 8))
+        itxn.AssetTransfer(
+            xfer_asset     = asset,
+            asset_receiver = Txn.sender,
+            asset_amount   = units,
+            fee            = Global.min_txn_fee,
+        ).submit()
+
+        op.Box.replace(key, ASSET_CLAIMED_OFFSET, op.itob(Global.latest_timestamp))
+        arc4.emit(CreditClaimed(asset_id, arc4.Address(Txn.sender), arc4.UInt64(units)))
+        return arc4.UInt64(units)
+
+
+    @arc4.abimethod
+    def sync_supply(self, asset_id: arc4.UInt64) -> arc4.UInt64:
+        """
+        Recomputes a claimed credit's remaining (unretired) supply.
+
+        Retirements close units out to the ASA creator — this registry —
+        which never re-issues them, so after the claim every unit the
+        registry holds is retired. Anyone can call it.
+
+        Returns: remaining units
+        """
+        asset = Asset(asset_id.native)
+        key   = ASSET_PREFIX + op.itob(asset_id.native)
+        _size, indexed = op.Box.length(key)
+        assert indexed,                                                             "Credit not found"
+        assert op.btoi(op.Box.extract(key, ASSET_CLAIMED_OFFSET, 8)) != UInt64(0), "Not claimed yet"
+
+        retired, _opted_in = op.AssetHoldingGet.asset_balance(Global.current_application_address, asset)
+        remaining = op.btoi(op.Box.extract(key, ASSET_TOTAL_OFFSET, 8)) - retired
+        op.Box.replace(key, ASSET_REMAINING_OFFSET, op.itob(remaining))
+        arc4.emit(SupplySynced(asset_id, arc4.UInt64(remaining)))
+        return arc4.UInt64(remaining)
 
 
     # ─────────────────────────────────────────
@@ -167,6 +605,8 @@ class CreditIssuanceRegistry(ARC4Contract):
 
         Compares expiry timestamp against current blockchain time.
         This is the source of truth — blockchain time cannot be faked.
+        A credit is expired from its expiry timestamp on, the same instant
+        the marketplace stops selling it.
         """
         box_value, box_exists = op.Box.get(project_id.bytes)
         assert box_exists, "Project not found"
@@ -174,7 +614,17 @@ class CreditIssuanceRegistry(ARC4Contract):
         expiry_timestamp = op.btoi(op.extract(box_value, 32, 8))
 
         # Compare expiry against current blockchain timestamp
-        return arc4.Bool(Global.latest_timestamp > expiry_timestamp)
+        return arc4.Bool(Global.latest_timestamp >= expiry_timestamp)
+
+
+    @arc4.abimethod(readonly=True)
+    def is_asset_expired(self, asset_id: arc4.UInt64) -> arc4.Bool:
+        """Same as is_credit_expired(), looked up by ASA ID."""
+        box_value, box_exists = op.Box.get(ASSET_PREFIX + op.itob(asset_id.native))
+        assert box_exists, "Credit not found"
+
+        expiry_timestamp = op.btoi(op.extract(box_value, 32, 8))
+        return arc4.Bool(Global.latest_timestamp >= expiry_timestamp)
 
 
     @arc4.abimethod(readonly=True)
@@ -188,6 +638,155 @@ class CreditIssuanceRegistry(ARC4Contract):
         return arc4.UInt64(op.btoi(op.extract(box_value, 32, 8)))
 
 
+    @arc4.abimethod(readonly=True)
+    def get_credit_expiry_by_asset(self, asset_id: arc4.UInt64) -> arc4.UInt64:
+        """
+        Returns the expiry Unix timestamp of a credit by its ASA ID.
+        See get_credit_terms() for expiry and CO2 per unit in one call.
+        """
+        box_value, box_exists = op.Box.get(ASSET_PREFIX + op.itob(asset_id.native))
+        assert box_exists, "Credit not found"
+        return arc4.UInt64(op.btoi(op.extract(box_value, 32, 8)))
+
+
+    @arc4.abimethod(readonly=True)
+    def get_credit_terms(
+        self,
+        asset_id: arc4.UInt64,
+    ) -> tuple[arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64]:
+        """
+        Returns (expiry_timestamp, co2_kg_per_unit, vintage_year, market_id)
+        for a credit by ASA ID: what CarbonMarketplace stores with a listing
+        and matches bids on, and what RetirementRegistry multiplies the
+        retired units by. market_id identifies the project type given at
+        mint, see ASSET_PREFIX.
+        """
+        box_value, box_exists = op.Box.get(ASSET_PREFIX + op.itob(asset_id.native))
+        assert box_exists, "Credit not found"
+
+        co2_tonnes  = op.btoi(op.extract(box_value, 8, 8))
+        total_units = op.btoi(op.extract(box_value, ASSET_TOTAL_OFFSET, 8))
+        return (
+            arc4.UInt64(op.btoi(op.extract(box_value, 32, 8))),
+            arc4.UInt64(co2_tonnes * UInt64(KG_PER_TONNE) // total_units),
+            arc4.UInt64(op.btoi(op.extract(box_value, 16, 8))),
+            arc4.UInt64(op.btoi(op.extract(box_value, ASSET_MARKET_OFFSET, 8))),
+        )
+
+
+    @arc4.abimethod(readonly=True)
+    def get_credit_by_asset(
+        self,
+        asset_id: arc4.UInt64,
+    ) -> tuple[arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64]:
+        """
+        Returns (co2_tonnes, vintage_year, mint_time, expiry_timestamp)
+        for a credit, in one box read by ASA ID.
+        """
+        box_value, box_exists = op.Box.get(ASSET_PREFIX + op.itob(asset_id.native))
+        assert box_exists, "Credit not found"
+        return (
+            arc4.UInt64(op.btoi(op.extract(box_value, 8, 8))),
+            arc4.UInt64(op.btoi(op.extract(box_value, 16, 8))),
+            arc4.UInt64(op.btoi(op.extract(box_value, 24, 8))),
+            arc4.UInt64(op.btoi(op.extract(box_value, 32, 8))),
+        )
+
+
+    @arc4.abimethod(readonly=True)
+    def get_credit_expiries(
+        self,
+        project_ids: arc4.DynamicArray[arc4.String],
+    ) -> arc4.DynamicArray[CreditStatus]:
+        """
+        Bulk get_credit_asset_id()/get_credit_expiry()/is_credit_expired():
+        one entry per project ID, in order, with found=False for unknown
+        projects. At most MAX_BULK_LOOKUP IDs.
+        """
+        assert project_ids.length <= UInt64(MAX_BULK_LOOKUP), "Too many keys in one call"
+
+        results = arc4.DynamicArray[CreditStatus]()
+        for i in urange(project_ids.length):
+            box_value, box_exists = op.Box.get(project_ids[i].bytes)
+            if box_exists:
+                expiry = op.btoi(op.extract(box_value, 32, 8))
+                results.append(CreditStatus(
+                    found    = arc4.Bool(True),
+                    expired  = arc4.Bool(Global.latest_timestamp >= expiry),
+                    asset_id = arc4.UInt64(op.btoi(op.extract(box_value, 0, 8))),
+                    expiry   = arc4.UInt64(expiry),
+                ))
+            else:
+                results.append(CreditStatus(
+                    found    = arc4.Bool(False),
+                    expired  = arc4.Bool(False),
+                    asset_id = arc4.UInt64(0),
+                    expiry   = arc4.UInt64(0),
+                ))
+
+        return results
+
+
+    @arc4.abimethod(readonly=True)
+    def get_credits_by_asset(
+        self,
+        asset_ids: arc4.DynamicArray[arc4.UInt64],
+    ) -> arc4.DynamicArray[CreditInfo]:
+        """
+        Bulk get_credit_by_asset()/is_asset_expired(): one entry per ASA ID,
+        in order, with found=False for assets the registry has not indexed.
+        At most MAX_BULK_LOOKUP IDs.
+        """
+        assert asset_ids.length <= UInt64(MAX_BULK_LOOKUP), "Too many keys in one call"
+
+        results = arc4.DynamicArray[CreditInfo]()
+        for asset_id in asset_ids:
+            box_value, box_exists = op.Box.get(ASSET_PREFIX + op.itob(asset_id.native))
+            if box_exists:
+                expiry = op.btoi(op.extract(box_value, 32, 8))
+                results.append(CreditInfo(
+                    found           = arc4.Bool(True),
+                    expired         = arc4.Bool(Global.latest_timestamp >= expiry),
+                    co2_tonnes      = arc4.UInt64(op.btoi(op.extract(box_value, 8, 8))),
+                    vintage_year    = arc4.UInt64(op.btoi(op.extract(box_value, 16, 8))),
+                    mint_time       = arc4.UInt64(op.btoi(op.extract(box_value, 24, 8))),
+                    expiry          = arc4.UInt64(expiry),
+                    remaining_units = arc4.UInt64(op.btoi(op.extract(box_value, ASSET_REMAINING_OFFSET, 8))),
+                ))
+            else:
+                results.append(CreditInfo(
+                    found           = arc4.Bool(False),
+                    expired         = arc4.Bool(False),
+                    co2_tonnes      = arc4.UInt64(0),
+                    vintage_year    = arc4.UInt64(0),
+                    mint_time       = arc4.UInt64(0),
+                    expiry          = arc4.UInt64(0),
+                    remaining_units = arc4.UInt64(0),
+                ))
+
+        return results
+
+
+    @arc4.abimethod(readonly=True)
+    def get_credit_supply(
+        self,
+        asset_id: arc4.UInt64,
+    ) -> tuple[arc4.UInt64, arc4.UInt64, arc4.UInt64]:
+        """
+        Returns (total_units, remaining_units, claimed_at) for a credit.
+        remaining_units is as of the last sync_supply(), which the
+        retirement registry calls on every retirement; claimed_at is 0
+        until claim_credit().
+        """
+        box_value, box_exists = op.Box.get(ASSET_PREFIX + op.itob(asset_id.native))
+        assert box_exists, "Credit not found"
+        return (
+            arc4.UInt64(op.btoi(op.extract(box_value, ASSET_TOTAL_OFFSET, 8))),
+            arc4.UInt64(op.btoi(op.extract(box_value, ASSET_REMAINING_OFFSET, 8))),
+            arc4.UInt64(op.btoi(op.extract(box_value, ASSET_CLAIMED_OFFSET, 8))),
+        )
+
+
     @arc4.abimethod(readonly=True)
     def get_credit_asset_id(self, project_id: arc4.String) -> arc4.UInt64:
         """Returns the ASA ID for a given project ID."""
@@ -201,13 +800,24 @@ class CreditIssuanceRegistry(ARC4Contract):
         self,
         issuer: arc4.Address,
     ) -> tuple[arc4.UInt64, arc4.UInt64]:
-        """Returns (is_verified, credits_issued)."""
+        """Returns (is_verified, credits_issued). Unregistered issuers read as (0, 0)."""
+        record, registered = op.Box.get(ISSUER_PREFIX + issuer.bytes)
+        if not registered:
+            return arc4.UInt64(0), arc4.UInt64(0)
         return (
-            arc4.UInt64(self.issuer_verified[issuer.native]),
-            arc4.UInt64(self.issuer_credits[issuer.native]),
+            arc4.UInt64(op.btoi(op.extract(record, 0, 1))),
+            arc4.UInt64(op.btoi(op.extract(record, ISSUER_CREDITS_OFFSET, 8))),
         )
 
 
+    @arc4.abimethod(readonly=True)
+    def get_issuer(self, issuer: arc4.Address) -> Issuer:
+        """Returns the full issuer record (status, credits_issued, name, standard)."""
+        record, registered = op.Box.get(ISSUER_PREFIX + issuer.bytes)
+        assert registered, "Issuer not registered"
+        return Issuer.from_bytes(record)
+
+
     @arc4.abimethod(readonly=True)
     def get_total_issued(self) -> arc4.UInt64:
         """Returns total credits ever minted."""
@@ -2,9 +2,9 @@ from algopy import (
     ARC4Contract,
     Asset,
     GlobalState,
-    LocalState,
     UInt64,
     Bytes,
+    BigUInt,
     Account,
     Txn,
     Global,
@@ -12,18 +12,399 @@ from algopy import (
     itxn,
     op,
     gtxn,
+    Application,
+    subroutine,
+    urange,
 )
 
 
+# Box key prefix for the seller/platform proceeds ledger: prefix | account(32)
+PROCEEDS_PREFIX = b"p_"
+
+# Listing boxes: prefix | listing_id(8) → Listing. Ids come from
+# next_listing_id and start at 1, so a listing id of 0 means "none".
+LISTING_PREFIX  = b"l_"
+LISTING_VERSION = 1
+LISTING_SIZE    = 98
+
+# Listing status. A listing box only exists while the listing is open (it
+# is deleted when the listing sells out, is cancelled or is swept), so
+# every stored listing has this status.
+LISTING_ACTIVE = 1
+
+# Sorted index boxes hold 16-byte entries in ascending byte order and are
+# capped so one index always fits a single 4 KB box read.
+INDEX_ENTRY_SIZE = 16
+INDEX_CAPACITY   = 256
+
+# Price index: one box per (project_type, vintage) market, keyed
+# prefix | market_id(8) | vintage(2), holding price(8) | listing_id(8) entries.
+PRICE_INDEX_PREFIX = b"x_"
+MAX_BEST_OFFERS    = 32
+
+# Active listing set: a dense array of listing_id(8) spread over page boxes
+# (prefix | page(8)) of up to ACTIVE_PAGE_SIZE ids. Removal swaps the last
+# id into the freed slot; each listing records its slot (list_slot).
+ACTIVE_PAGE_PREFIX = b"a_"
+ACTIVE_PAGE_SIZE   = 512
+MAX_LISTINGS_PAGE  = 11
+
+# Market depth: one MarketDepth box per (project_type, vintage) market,
+# keyed prefix | market_id(8) | vintage(2) like the price index.
+DEPTH_PREFIX = b"d_"
+DEPTH_SIZE   = 40
+
+# Bids: one box per bid (prefix | bid_id(8) → Bid) and one bid book per
+# project type (prefix | market_id(8)) holding ~max_price(8) | bid_id(8)
+# entries, so ascending order is best price first, then oldest bid.
+BID_PREFIX               = b"b_"
+BID_BOOK_PREFIX          = b"k_"
+BID_SIZE                 = 66
+BID_QUANTITY_OFFSET      = 50
+BID_CLAIM_DEPOSIT_OFFSET = 58
+MAX_BID_SCAN             = 8
+
+# Units bought for an account not yet opted in to the asset:
+# prefix | account(32) | asset_id(8) → amount(8), collected with claim_credits()
+CLAIM_PREFIX = b"c_"
+
+# Business registry: prefix | account(32) → Business. status is the first
+# byte so it can be read without decoding the record.
+BUSINESS_PREFIX        = b"u_"
+BUSINESS_BOUGHT_OFFSET = 1
+MAX_BUSINESS_FIELD     = 64
+
+# Business status
+BUSINESS_PENDING  = 0
+BUSINESS_VERIFIED = 1
+BUSINESS_REJECTED = 2
+
+# Box minimum balance: flat + per byte of key and value. Registrations pay
+# it up front and get it back when they deregister.
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+
+# Listings, bids and held units pay a deposit for the boxes they occupy
+# (see get_deposits), so box MBR never comes out of the escrow and
+# proceeds the contract holds. It is refunded when the box is deleted:
+# - listing: its box plus its seller index, active set and price index
+#   entries, each priced as the only entry of its box. Credited to the
+#   seller's proceeds when the listing closes.
+# - bid: its box and bid book entry, plus one claim deposit for units a
+#   fill holds for the bidder. Returned with the escrow.
+# - claim: the CLAIM_PREFIX box of held units, paid by whoever creates
+#   it and returned by claim_credits().
+# - depth: the first listing of a market pays for its depth box, which
+#   is kept for the market's history and not refunded.
+
+# Credits per list_credits() call. Each listing references its issuance
+# asset box and listing box; the market's price index, bid book and the
+# seller index are 4 KB boxes (4 references each), plus the depth and
+# active page boxes and the issuance app. The bound is the 1 KB log
+# budget: 7 Listed logs (98 bytes), the returned ids and at most
+# MAX_LIST_FILLS BidFilled logs (85 bytes) across the whole call.
+MAX_LIST_BATCH = 7
+MAX_LIST_FILLS = 3
+
+# Box references closing a listing can need: its own box (1), the price
+# index and seller index (4 KB, 4 each), the active page of its slot and
+# the last active page (4 each), the two listings re-pointed by the
+# swap-removes (1 each) and the market depth box (1). A group carries at
+# most 16 transactions of 8 references; the call itself and the
+# add_box_references() calls placed after it carry them.
+CLOSE_REFERENCES = 20
+
+# Listings per buy_credits() call, from the reference budget: the payment,
+# the call and 14 add_box_references() calls carry 15 × 8 = 120 references.
+# The buyer's business box and the admin's proceeds box take 2; each
+# listing needs CLOSE_REFERENCES plus its asset, the seller's proceeds box
+# and the buyer's claim box, 23, so 5 fit. 5 Sold logs (109 bytes) fit 1 KB.
+MAX_BUY_BATCH = 5
+
+# Listings per sweep_expired() call: the call and 15 add_box_references()
+# calls carry 128 references; each listing needs CLOSE_REFERENCES plus
+# its asset, seller account and seller proceeds box, 23, so 5 fit.
+MAX_SWEEP_BATCH = 5
+
+# Listings per update_listings() call: one Repriced log each, 32 logs at most
+MAX_UPDATE_BATCH = 32
+
+# Addresses per set_business_statuses() call; each needs its box referenced.
+# One 37-byte BusinessStatusChanged log each keeps the call under the
+# 32-log and 1 KB log limits.
+MAX_STATUS_BATCH = 24
+
+# Addresses per get_business_statuses() call: 10-byte entries in one ABI return
+MAX_STATUS_LOOKUP = 64
+
+# Encoded size of a ListingLookup: 2 packed flags(1) + ListingView(86)
+LISTING_LOOKUP_SIZE = 87
+
+# Byte offsets of Listing fields that are updated in place
+LISTING_PRICE_OFFSET       = 60
+LISTING_MIN_QTY_OFFSET     = 76
+LISTING_QUANTITY_OFFSET    = 84
+LISTING_SELLER_SLOT_OFFSET = 92
+LISTING_LIST_SLOT_OFFSET   = 94
+
+# Per-seller index: prefix | seller(32) → packed listing_id(8) list of the
+# seller's active listings, unordered (swap-remove). Each listing records
+# its slot so removal is O(1).
+SELLER_INDEX_PREFIX   = b"s_"
+SELLER_INDEX_CAPACITY = 512
+MAX_SELLER_PAGE       = 120
+
+
+class Listing(arc4.Struct):
+    """
+    Listing box value, keyed by LISTING_PREFIX | itob(listing_id). 98 bytes.
+
+    version(1)   | status(1)   | vintage(2) | listed_at(4) | expiry(4) |
+    market_id(8) | asset_id(8) | seller(32) | price(8)     | co2(8)    |
+    min_qty(8)   | quantity(8) | seller_slot(2) | list_slot(4)
+
+    price and co2_kg are per unit of the listed ASA (co2_kg comes from the
+    issuance registry, so kilogram units of a decimals=3 tranche are exact);
+    quantity is the number of units still for sale. market_id identifies the project type
+    (see _market_id). Several sellers of a fungible credit can each have
+    their own listings of the same asset.
+    """
+    version:          arc4.UInt8
+    status:           arc4.UInt8
+    vintage_year:     arc4.UInt16
+    listed_at:        arc4.UInt32
+    expiry:           arc4.UInt32
+    market_id:        arc4.UInt64
+    asset_id:         arc4.UInt64
+    seller:           arc4.Address
+    price:            arc4.UInt64
+    co2_kg:           arc4.UInt64
+    min_purchase_qty: arc4.UInt64
+    quantity:         arc4.UInt64
+    seller_slot:      arc4.UInt16
+    list_slot:        arc4.UInt32
+
+
+class Business(arc4.Struct):
+    """Business registry record, boxed under BUSINESS_PREFIX | account."""
+    status:         arc4.UInt8
+    credits_bought: arc4.UInt64
+    name:           arc4.String
+    country:        arc4.String
+
+
+# ─────────────────────────────────────────
+#  ARC-28 EVENTS
+# ─────────────────────────────────────────
+
+class BusinessRegistered(arc4.Struct):
+    """ARC-28 event: a business registered (status pending)."""
+    business: arc4.Address
+    name:     arc4.String
+    country:  arc4.String
+
+
+class BusinessDeregistered(arc4.Struct):
+    """ARC-28 event: a business deleted its registration and took back its MBR."""
+    business: arc4.Address
+
+
+class BusinessStatusChanged(arc4.Struct):
+    """ARC-28 event emitted each time the admin sets a business's status."""
+    business: arc4.Address
+    status:   arc4.UInt8
+
+
+class IssuanceRegistrySet(arc4.Struct):
+    """ARC-28 event: the admin pointed the marketplace at an issuance registry."""
+    registry: arc4.UInt64
+
+
+class RetirementRegistrySet(arc4.Struct):
+    """ARC-28 event: the admin pointed the marketplace at a retirement registry."""
+    registry: arc4.UInt64
+
+
+class Listed(arc4.Struct):
+    """ARC-28 event: a listing was opened (after any standing bids were filled)."""
+    listing_id:       arc4.UInt64
+    asset_id:         arc4.UInt64
+    seller:           arc4.Address
+    market_id:        arc4.UInt64
+    vintage_year:     arc4.UInt16
+    expiry:           arc4.UInt32
+    price:            arc4.UInt64
+    co2_kg:           arc4.UInt64
+    min_purchase_qty: arc4.UInt64
+    quantity:         arc4.UInt64
+
+
+class Sold(arc4.Struct):
+    """
+    ARC-28 event: units of a listing were bought (bid fills emit BidFilled).
+    held is set when the units wait for the buyer in claim_credits().
+    """
+    listing_id: arc4.UInt64
+    asset_id:   arc4.UInt64
+    seller:     arc4.Address
+    buyer:      arc4.Address
+    quantity:   arc4.UInt64
+    price:      arc4.UInt64   # per unit
+    cost:       arc4.UInt64
+    held:       arc4.Bool
+
+
+class Cancelled(arc4.Struct):
+    """ARC-28 event: the seller cancelled a listing and took back its units."""
+    listing_id: arc4.UInt64
+    asset_id:   arc4.UInt64
+    seller:     arc4.Address
+    quantity:   arc4.UInt64
+
+
+class Repriced(arc4.Struct):
+    """ARC-28 event: the seller changed a listing's price or minimum quantity."""
+    listing_id:       arc4.UInt64
+    price:            arc4.UInt64
+    min_purchase_qty: arc4.UInt64
+
+
+class Expired(arc4.Struct):
+    """ARC-28 event: sweep_expired() closed an expired listing and returned its units."""
+    listing_id: arc4.UInt64
+    asset_id:   arc4.UInt64
+    seller:     arc4.Address
+    quantity:   arc4.UInt64
+
+
+class ProceedsWithdrawn(arc4.Struct):
+    """ARC-28 event: an account collected its proceeds."""
+    account: arc4.Address
+    amount:  arc4.UInt64
+
+
+class BidPlaced(arc4.Struct):
+    """ARC-28 event: a standing bid was placed."""
+    bid_id:          arc4.UInt64
+    bidder:          arc4.Address
+    market_id:       arc4.UInt64
+    max_vintage_age: arc4.UInt16
+    max_price:       arc4.UInt64
+    quantity:        arc4.UInt64
+
+
+class BidFilled(arc4.Struct):
+    """
+    ARC-28 event: a new listing (partly) filled a bid at the listing price.
+    The seller is the sender of the listing call; held is set when the
+    units wait for the bidder in claim_credits().
+    """
+    bid_id:     arc4.UInt64
+    listing_id: arc4.UInt64
+    asset_id:   arc4.UInt64
+    bidder:     arc4.Address
+    quantity:   arc4.UInt64
+    price:      arc4.UInt64   # per unit
+    remaining:  arc4.UInt64   # left on the bid
+    held:       arc4.Bool
+
+
+class BidCancelled(arc4.Struct):
+    """ARC-28 event: the bidder cancelled a bid and got its escrow back."""
+    bid_id: arc4.UInt64
+    bidder: arc4.Address
+    refund: arc4.UInt64
+
+
+class CreditsClaimed(arc4.Struct):
+    """ARC-28 event: an account collected held units with claim_credits()."""
+    account:  arc4.Address
+    asset_id: arc4.UInt64
+    amount:   arc4.UInt64
+
+
+class ListingSpec(arc4.Struct):
+    """One credit to list via list_credits(); fields as in list_credit()."""
+    asset_id:              arc4.UInt64
+    price_microalgo:       arc4.UInt64
+    vintage_year:          arc4.UInt64
+    project_type:          arc4.String
+    verification_standard: arc4.String
+    min_purchase_qty:      arc4.UInt64
+    ipfs_metadata_hash:    arc4.String
+
+
+class Bid(arc4.Struct):
+    """
+    Standing buy order, keyed by BID_PREFIX | itob(bid_id). 66 bytes.
+    The contract holds max_price × quantity in escrow for it, plus the
+    box deposit; claim_deposit drops to 0 once a fill has used it.
+    """
+    bidder:          arc4.Address
+    market_id:       arc4.UInt64
+    max_vintage_age: arc4.UInt16
+    max_price:       arc4.UInt64
+    quantity:        arc4.UInt64
+    claim_deposit:   arc4.UInt64
+
+
+class MarketDepth(arc4.Struct):
+    """
+    Running totals for one (project_type, vintage) market. 40 bytes.
+    kg_on_offer is co2_kg × unsold units; price_sum adds up unit prices
+    of active listings (average ask = price_sum / active_listings).
+    """
+    active_listings: arc4.UInt64
+    kg_on_offer:     arc4.UInt64
+    price_sum:       arc4.UInt64
+    traded_volume:   arc4.UInt64
+    trade_count:     arc4.UInt64
+
+
+class ListingView(arc4.Struct):
+    """One active listing, as returned by get_listings_page()."""
+    listing_id:       arc4.UInt64
+    asset_id:         arc4.UInt64
+    seller:           arc4.Address
+    price:            arc4.UInt64
+    co2_kg:           arc4.UInt64
+    min_purchase_qty: arc4.UInt64
+    quantity:         arc4.UInt64
+    vintage_year:     arc4.UInt16
+    expiry:           arc4.UInt32
+
+
+class ListingLookup(arc4.Struct):
+    """One entry of get_listings(); all zero with found=False if no listing box."""
+    found:   arc4.Bool
+    expired: arc4.Bool
+    listing: ListingView
+
+
+class BusinessLookup(arc4.Struct):
+    """One entry of get_business_statuses(); found=False if unregistered."""
+    found:          arc4.Bool
+    status:         arc4.UInt8
+    credits_bought: arc4.UInt64
+
+
+class Offer(arc4.Struct):
+    """One price index entry, as returned by best_offers()."""
+    listing_id: arc4.UInt64
+    asset_id:   arc4.UInt64
+    price:      arc4.UInt64
+
+
 class CarbonMarketplace(ARC4Contract):
     """
     Contract 2 — Carbon Credit Marketplace (with Expiry Enforcement)
 
     New expiry features:
-    - Expiry timestamp stored in every listing
+    - Expiry timestamp read from the issuance registry and stored in every listing
     - buy_credit() rejects expired credits on-chain
     - get_listing() returns expiry so frontend can show countdown
-    - Expired listings can be cleaned up by anyone
+    - Expired listings can be cleaned up by anyone (sweep_expired)
+    - Sold and cancelled listing boxes are deleted to release their MBR
     """
 
     def __init__(self) -> None:
@@ -31,12 +412,11 @@ class CarbonMarketplace(ARC4Contract):
         self.platform_fee_bps       = GlobalState(UInt64)
         self.total_volume_microalgo = GlobalState(UInt64)
         self.total_trades           = GlobalState(UInt64)
-
-        # Business local state
-        self.business_verified     = LocalState(UInt64)
-        self.business_name         = LocalState(Bytes)
-        self.business_country      = LocalState(Bytes)
-        self.total_credits_bought  = LocalState(UInt64)
+        self.next_bid_id            = GlobalState(UInt64)
+        self.active_listing_count   = GlobalState(UInt64)
+        self.next_listing_id        = GlobalState(UInt64)
+        self.issuance_app           = GlobalState(Application)
+        self.retirement_app         = GlobalState(Application)
 
 
     # ─────────────────────────────────────────
@@ -50,6 +430,35 @@ class CarbonMarketplace(ARC4Contract):
         self.platform_fee_bps.value       = fee_bps.native
         self.total_volume_microalgo.value = UInt64(0)
         self.total_trades.value           = UInt64(0)
+        self.next_bid_id.value            = UInt64(0)
+        self.active_listing_count.value   = UInt64(0)
+        self.next_listing_id.value        = UInt64(1)
+        self.issuance_app.value           = Application(0)
+        self.retirement_app.value         = Application(0)
+
+
+    @arc4.abimethod
+    def set_issuance_registry(self, registry: Application) -> None:
+        """
+        Admin points the marketplace at the CreditIssuanceRegistry.
+        Listings read credit expiry from it, so nothing can be listed
+        until this is set.
+        """
+        assert Txn.sender == self.admin.value, "Admin only"
+        self.issuance_app.value = registry
+        arc4.emit(IssuanceRegistrySet(arc4.UInt64(registry.id)))
+
+
+    @arc4.abimethod
+    def set_retirement_registry(self, registry: Application) -> None:
+        """
+        Admin points the marketplace at the RetirementRegistry that
+        buy_and_retire() deposits into; buy_and_retire() fails until
+        this is set.
+        """
+        assert Txn.sender == self.admin.value, "Admin only"
+        self.retirement_app.value = registry
+        arc4.emit(RetirementRegistrySet(arc4.UInt64(registry.id)))
 
 
     # ─────────────────────────────────────────
@@ -62,25 +471,162 @@ class CarbonMarketplace(ARC4Contract):
         name:    arc4.String,
         country: arc4.String,
     ) -> None:
-        """Company registers to buy credits. Starts pending."""
-        self.business_name[Txn.sender]          = name.bytes
-        self.business_country[Txn.sender]        = country.bytes
-        self.business_verified[Txn.sender]       = UInt64(0)
-        self.total_credits_bought[Txn.sender]    = UInt64(0)
+        """
+        Company registers to buy credits. Starts pending.
+
+        No opt-in needed: the record is a box (see Business). The company
+        pays its minimum balance, 2500 + 400 × (key + record bytes)
+        microALGO, and gets it back with deregister_business(). Reference
+        box BUSINESS_PREFIX + sender.
+
+        Call as atomic group:
+            [0] Payment  — company pays the box MBR to contract
+            [1] AppCall  — this method
+        """
+        assert Txn.group_index > UInt64(0),                        "Must be in atomic group"
+        assert name.bytes.length <= UInt64(MAX_BUSINESS_FIELD),    "Name too long"
+        assert country.bytes.length <= UInt64(MAX_BUSINESS_FIELD), "Country too long"
+
+        key = BUSINESS_PREFIX + Txn.sender.bytes
+        _size, registered = op.Box.length(key)
+        assert not registered, "Already registered"
+
+        record = Business(
+            status         = arc4.UInt8(BUSINESS_PENDING),
+            credits_bought = arc4.UInt64(0),
+            name           = name,
+            country        = country,
+        ).bytes
+
+        pay = gtxn.PaymentTransaction(Txn.group_index - UInt64(1))
+        assert pay.sender   == Txn.sender,                                  "Payment sender mismatch"
+        assert pay.receiver == Global.current_application_address,          "Wrong receiver"
+        assert pay.amount   == self._box_mbr(key.length + record.length),   "Wrong MBR payment"
+
+        op.Box.put(key, record)
+        arc4.emit(BusinessRegistered(arc4.Address(Txn.sender), name, country))
+
+
+    @arc4.abimethod
+    def deregister_business(self) -> None:
+        """
+        Company deletes its registration and is refunded the box MBR it
+        paid. Registering again starts pending with no credits bought.
+        The refund's fee comes from this call: pay 2 × min fee.
+        """
+        key = BUSINESS_PREFIX + Txn.sender.bytes
+        size, registered = op.Box.length(key)
+        assert registered, "Business not registered"
+
+        op.Box.delete(key)
+        itxn.Payment(
+            receiver = Txn.sender,
+            amount   = self._box_mbr(key.length + size),
+            fee      = 0,
+        ).submit()
+        arc4.emit(BusinessDeregistered(arc4.Address(Txn.sender)))
+
+
+    @subroutine
+    def _box_mbr(self, size: UInt64) -> UInt64:
+        """Minimum balance of a box with key and value totalling size bytes."""
+        return UInt64(BOX_FLAT_MIN_BALANCE) + UInt64(BOX_BYTE_MIN_BALANCE) * size
+
+
+    @subroutine
+    def _listing_deposit(self) -> UInt64:
+        """Box deposit of one listing: its box and its three index entries."""
+        return (
+            self._box_mbr(UInt64(len(LISTING_PREFIX) + 8 + LISTING_SIZE))
+            + self._box_mbr(UInt64(len(SELLER_INDEX_PREFIX) + 32 + 8))
+            + self._box_mbr(UInt64(len(ACTIVE_PAGE_PREFIX) + 8 + 8))
+            + self._box_mbr(UInt64(len(PRICE_INDEX_PREFIX) + 10 + INDEX_ENTRY_SIZE))
+        )
+
+
+    @subroutine
+    def _bid_deposit(self) -> UInt64:
+        """Box deposit of one bid: its box and bid book entry (the claim deposit is separate)."""
+        return (
+            self._box_mbr(UInt64(len(BID_PREFIX) + 8 + BID_SIZE))
+            + self._box_mbr(UInt64(len(BID_BOOK_PREFIX) + 8 + INDEX_ENTRY_SIZE))
+        )
+
+
+    @subroutine
+    def _claim_deposit(self) -> UInt64:
+        """Box deposit of one CLAIM_PREFIX | account | asset_id box of held units."""
+        return self._box_mbr(UInt64(len(CLAIM_PREFIX) + 32 + 8 + 8))
+
+
+    @subroutine
+    def _check_deposit(self, pay: gtxn.PaymentTransaction, amount: UInt64) -> None:
+        """Asserts pay is the sender's box deposit of amount to the contract."""
+        assert pay.sender   == Txn.sender,                           "Payment sender mismatch"
+        assert pay.receiver == Global.current_application_address,   "Wrong receiver"
+        assert pay.amount   == amount,                               "Wrong deposit amount"
 
 
     @arc4.abimethod
     def verify_business(self, business: arc4.Address) -> None:
         """Admin approves a business."""
         assert Txn.sender == self.admin.value, "Admin only"
-        self.business_verified[business.native] = UInt64(1)
+        self._set_business_status(business, arc4.UInt8(BUSINESS_VERIFIED))
 
 
     @arc4.abimethod
     def reject_business(self, business: arc4.Address) -> None:
         """Admin rejects a business."""
         assert Txn.sender == self.admin.value, "Admin only"
-        self.business_verified[business.native] = UInt64(2)
+        self._set_business_status(business, arc4.UInt8(BUSINESS_REJECTED))
+
+
+    @arc4.abimethod
+    def set_business_statuses(
+        self,
+        businesses: arc4.DynamicArray[arc4.Address],
+        statuses:   arc4.DynamicArray[arc4.UInt8],
+    ) -> None:
+        """
+        Admin applies a KYC queue in one call: businesses[i] gets
+        statuses[i] (0=pending, 1=verified, 2=rejected), emitting one
+        BusinessStatusChanged event per business. Up to MAX_STATUS_BATCH
+        addresses; every business box must be referenced in the group.
+        """
+        assert Txn.sender == self.admin.value,                    "Admin only"
+        assert statuses.length == businesses.length,              "One status per business"
+        assert businesses.length <= UInt64(MAX_STATUS_BATCH),     "Too many businesses in one call"
+
+        for i in urange(businesses.length):
+            self._set_business_status(businesses[i], statuses[i])
+
+
+    @subroutine
+    def _set_business_status(self, business: arc4.Address, status: arc4.UInt8) -> None:
+        assert status.native <= UInt64(BUSINESS_REJECTED), "Invalid status"
+
+        key = BUSINESS_PREFIX + business.bytes
+        _size, registered = op.Box.length(key)
+        assert registered, "Business not registered"
+        op.Box.replace(key, 0, status.bytes)
+        arc4.emit(BusinessStatusChanged(business, status))
+
+
+    @subroutine
+    def _business_verified(self, business: Account) -> bool:
+        """True if the account has a business record with BUSINESS_VERIFIED status."""
+        key = BUSINESS_PREFIX + business.bytes
+        _size, registered = op.Box.length(key)
+        if not registered:
+            return False
+        return op.Box.extract(key, 0, 1) == arc4.UInt8(BUSINESS_VERIFIED).bytes
+
+
+    @subroutine
+    def _add_credits_bought(self, business: Account, quantity: UInt64) -> None:
+        key    = BUSINESS_PREFIX + business.bytes
+        bought = op.btoi(op.Box.extract(key, BUSINESS_BOUGHT_OFFSET, 8))
+        op.Box.replace(key, BUSINESS_BOUGHT_OFFSET, op.itob(bought + quantity))
 
 
     # ─────────────────────────────────────────
@@ -92,236 +638,1580 @@ class CarbonMarketplace(ARC4Contract):
         self,
         asset_id:              arc4.UInt64,
         price_microalgo:       arc4.UInt64,
-        co2_tonnes:            arc4.UInt64,
         vintage_year:          arc4.UInt64,
         project_type:          arc4.String,
         verification_standard: arc4.String,
         min_purchase_qty:      arc4.UInt64,
         ipfs_metadata_hash:    arc4.String,
-        expiry_timestamp:      arc4.UInt64,   # ← NEW: Unix expiry from issuance contract
-    ) -> None:
+    ) -> arc4.UInt64:
+        """
+        NGO lists carbon credit units for sale.
+
+        The credit's expiry and CO2 per unit (in kg) are read from the
+        issuance registry with an inner get_credit_terms() call and stored
+        so that buy_credit() can enforce expiry on-chain. vintage_year and
+        project_type must match the ones the registry recorded at mint.
+        The call must reference the registry app and its
+        b"asset:" + itob(asset_id) box.
+
+        Any amount of the ASA can be listed: a single-unit NFT, or many
+        units of a fungible credit that buyers can purchase in parts.
+        price_microalgo is per unit; buyers must take at least
+        min_purchase_qty units (or whatever is left).
+
+        Call as atomic group:
+            [0] Payment       — seller pays the listing deposit to contract,
+                                see get_deposits() (plus the depth box if
+                                this is the market's first listing)
+            [1] AssetTransfer — seller sends the units to contract
+            [2] AppCall       — this method
+
+        Standing bids for the project type are filled first (see
+        place_bid); whatever is left is listed and added to the price
+        index for its (project_type, vintage_year) market, see best_offers().
+        If the bids take every unit, the listing deposit is credited back
+        to the seller's proceeds straight away.
+
+        Box layout: see Listing (98 bytes, keyed by LISTING_PREFIX + itob(listing_id))
+
+        Returns: listing id, used by buy_credit() and the other listing
+        methods (0 if standing bids took every unit)
+        """
+        assert Txn.group_index > UInt64(1), "Must be in atomic group"
+
+        listing_id, _fills, deposit = self._list(
+            Txn.group_index - UInt64(1),
+            asset_id.native,
+            price_microalgo.native,
+            vintage_year.native,
+            project_type.bytes,
+            min_purchase_qty.native,
+            UInt64(MAX_BID_SCAN),
+        )
+        self._check_deposit(gtxn.PaymentTransaction(Txn.group_index - UInt64(2)), deposit)
+        return arc4.UInt64(listing_id)
+
+
+    @arc4.abimethod
+    def list_credits(self, listings: arc4.DynamicArray[ListingSpec]) -> arc4.DynamicArray[arc4.UInt64]:
         """
-        NGO lists a carbon credit NFT for sale.
+        NGO lists many credits in one call.
+
+        listings[i] is checked against the i-th of the asset transfers
+        that directly precede this call, exactly as list_credit() checks
+        its single transfer.
 
-        expiry_timestamp: pass in the value from get_credit_expiry()
-        Contract stores it so buy_credit() can enforce it on-chain.
+        A call carries only 8 references, so the boxes the batch needs go
+        on add_box_references() calls after it. At most MAX_LIST_BATCH
+        credits; every market beyond the first costs ~10 references
+        (price index, bid book, depth box) and every matched bid its bid
+        and claim boxes. Standing bids are filled as in list_credit(), but
+        at most MAX_LIST_FILLS of them across the batch so the events fit
+        the log budget; the rest of the units are listed.
 
         Call as atomic group:
-            [0] AssetTransfer — seller sends NFT to contract
-            [1] AppCall       — this method
+            [0]      Payment       — seller pays n listing deposits, plus a
+                                     depth box for each new market
+            [1..n]   AssetTransfer — seller sends each credit to contract
+            [n+1]    AppCall       — this method
+            [n+2..]  AppCall       — add_box_references(), as needed
+
+        Returns: the listing id of each credit, in order (0 if filled by bids)
+        """
+        count = listings.length
+        assert count > UInt64(0),                  "No listings given"
+        assert count <= UInt64(MAX_LIST_BATCH),    "Too many listings in one call"
+        assert Txn.group_index > count,            "Missing asset transfers"
+
+        listing_ids = arc4.DynamicArray[arc4.UInt64]()
+        first       = Txn.group_index - count
+        fills_left  = UInt64(MAX_LIST_FILLS)
+        deposits    = UInt64(0)
+        for i in urange(count):
+            spec = listings[i].copy()
+            listing_id, fills, deposit = self._list(
+                first + i,
+                spec.asset_id.native,
+                spec.price_microalgo.native,
+                spec.vintage_year.native,
+                spec.project_type.bytes,
+                spec.min_purchase_qty.native,
+                fills_left,
+            )
+            fills_left -= fills
+            deposits   += deposit
+            listing_ids.append(arc4.UInt64(listing_id))
+
+        self._check_deposit(gtxn.PaymentTransaction(first - UInt64(1)), deposits)
+        return listing_ids
 
-        Box layout (total 96 bytes):
-        asset_id(8) | seller(32) | price(8) | co2(8) |
-        vintage(8)  | min_qty(8) | timestamp(8) | expiry(8) | active(8)
+
+    @arc4.abimethod
+    def add_box_references(self) -> None:
+        """
+        Does nothing. Extra calls to it, placed after a batch call such as
+        list_credits(), carry the app, asset and box references the batch
+        needs beyond the 8 of its own transaction.
+        """
+
+
+    @subroutine
+    def _list(
+        self,
+        transfer_index:   UInt64,
+        asset_id:         UInt64,
+        price_microalgo:  UInt64,
+        vintage_year:     UInt64,
+        project_type:     Bytes,
+        min_purchase_qty: UInt64,
+        max_fills:        UInt64,
+    ) -> tuple[UInt64, UInt64, UInt64]:
+        """
+        Validates one listing against its asset transfer, fills up to
+        max_fills standing bids and opens it with what is left.
+        Returns (listing id or 0 if the bids took every unit, bids filled,
+        deposit the seller owes for it).
         """
-        assert price_microalgo.native > UInt64(0),                    "Price must be > 0"
-        assert min_purchase_qty.native > UInt64(0),                   "Min qty must be > 0"
-        assert min_purchase_qty.native <= co2_tonnes.native,          "Min qty exceeds total"
-        assert Txn.group_index > UInt64(0),                           "Must be in atomic group"
+        assert price_microalgo > UInt64(0),                           "Price must be > 0"
+        assert min_purchase_qty > UInt64(0),                          "Min qty must be > 0"
 
         # ── Check credit is not already expired ───────────────────
-        assert Global.latest_timestamp < expiry_timestamp.native, "Cannot list an expired credit"
-
-        # ── Verify NFT was sent to contract ───────────────────────
-        prev = gtxn.AssetTransferTransaction(Txn.group_index - UInt64(1))
-        assert prev.asset_receiver == Global.current_application_address, "NFT must go to contract"
-        assert prev.xfer_asset.id  == asset_id.native,                    "Wrong asset ID"
-        assert prev.asset_amount   == UInt64(1),                          "Must send exactly 1"
-        assert prev.sender         == Txn.sender,                         "Sender mismatch"
-
-        # Box layout:
-        # offset 0  — asset_id        8 bytes
-        # offset 8  — seller          32 bytes
-        # offset 40 — price           8 bytes
-        # offset 48 — co2_tonnes      8 bytes
-        # offset 56 — vintage_year    8 bytes
-        # offset 64 — min_purchase    8 bytes
-        # offset 72 — listed_at       8 bytes
-        # offset 80 — expiry          8 bytes  ← NEW
-        # offset 88 — active          8 bytes
-        # Total: 96 bytes
-        op.Box.put(
-            op.itob(asset_id.native),
-            op.itob(asset_id.native)          +   # 0:8
-            Txn.sender.bytes                  +   # 8:40
-            op.itob(price_microalgo.native)   +   # 40:48
-            op.itob(co2_tonnes.native)        +   # 48:56
-            op.itob(vintage_year.native)      +   # 56:64
-            op.itob(min_purchase_qty.native)  +   # 64:72
-            op.itob(Global.latest_timestamp)  +   # 72:80
-            op.itob(expiry_timestamp.native)  +   # 80:88  ← expiry
-            op.itob(UInt64(1)),                   # 88:96  active=1
+        expiry_timestamp, co2_kg, registry_vintage, market_id = self._credit_terms(asset_id)
+        assert Global.latest_timestamp < expiry_timestamp, "Cannot list an expired credit"
+
+        # Bids are matched on vintage and project type, so both must be the
+        # ones the issuance registry recorded at mint
+        assert vintage_year == registry_vintage,           "Vintage does not match registry"
+        assert self._market_id(project_type) == market_id, "Project type does not match registry"
+
+        # ── Verify units were sent to contract ────────────────────
+        xfer = gtxn.AssetTransferTransaction(transfer_index)
+        assert xfer.asset_receiver == Global.current_application_address, "Credits must go to contract"
+        assert xfer.xfer_asset.id  == asset_id,                           "Wrong asset ID"
+        assert xfer.asset_amount   >= min_purchase_qty,                   "Min qty exceeds amount listed"
+        assert xfer.sender         == Txn.sender,                         "Sender mismatch"
+
+        listing_id = self.next_listing_id.value
+        self.next_listing_id.value = listing_id + UInt64(1)
+
+        deposit = self._listing_deposit()
+        _size, depth_exists = op.Box.length(self._depth_key(market_id, vintage_year))
+        if not depth_exists:
+            deposit += self._box_mbr(UInt64(len(DEPTH_PREFIX) + 10 + DEPTH_SIZE))
+
+        listing = self._pack_listing(
+            LISTING_ACTIVE,
+            vintage_year,
+            Global.latest_timestamp,
+            expiry_timestamp,
+            market_id,
+            asset_id,
+            Txn.sender,
+            price_microalgo,
+            co2_kg,
+            min_purchase_qty,
+            xfer.asset_amount,
         )
 
+        # Standing bids get the units first; only the rest is listed
+        remaining, fills = self._match_bids(listing_id, listing, max_fills)
+        if remaining == UInt64(0):
+            self._accrue_proceeds(Txn.sender, self._listing_deposit())
+            return UInt64(0), fills, deposit
+
+        listing.quantity = arc4.UInt64(remaining)
+        self._open_listing(listing_id, listing)
+        arc4.emit(Listed(
+            listing_id       = arc4.UInt64(listing_id),
+            asset_id         = listing.asset_id,
+            seller           = listing.seller.copy(),
+            market_id        = listing.market_id,
+            vintage_year     = listing.vintage_year,
+            expiry           = listing.expiry,
+            price            = listing.price,
+            co2_kg           = listing.co2_kg,
+            min_purchase_qty = listing.min_purchase_qty,
+            quantity         = listing.quantity,
+        ))
+        return listing_id, fills, deposit
+
 
     # ─────────────────────────────────────────
     #  BUY CREDIT (enforces expiry on-chain)
     # ─────────────────────────────────────────
 
     @arc4.abimethod
-    def buy_credit(self, asset_id: arc4.UInt64) -> None:
+    def buy_credit(self, listing_id: arc4.UInt64, quantity: arc4.UInt64) -> None:
         """
-        Verified business buys a listed carbon credit.
+        Verified business buys quantity units of a listed carbon credit.
 
         ✅ Checks:
         - Buyer is a verified business
         - Listing is active
         - Credit has NOT expired (enforced on-chain by blockchain time)
-        - Payment matches listing price
+        - quantity is at least min_purchase_qty (or the rest of the listing)
+        - Payment matches quantity × unit price
+
+        The listing stays open for other buyers until every unit is sold.
+
+        Seller payout and platform fee are credited to the proceeds
+        ledger; collect them with withdraw_proceeds().
+
+        A buyer not opted in to the asset has the units held for
+        claim_credits(); if that opens a new claim box, the payment also
+        carries the claim deposit (see get_deposits).
 
         Call as atomic group:
-            [0] Payment  — buyer pays exact price to contract
-            [1] AppCall  — this method
+            [0]  Payment  — buyer pays exact price (+ any claim deposit) to contract
+            [1]  AppCall  — this method
+            [2+] AppCall  — add_box_references(), up to 3: buying the last
+                            units closes the listing, which needs up to
+                            CLOSE_REFERENCES + 5 references (asset, buyer
+                            business and claim boxes, seller and admin
+                            proceeds boxes)
         """
         assert Txn.group_index > UInt64(0),                              "Must be in atomic group"
-        assert self.business_verified[Txn.sender] == UInt64(1),          "Business not verified"
+        assert self._business_verified(Txn.sender),                      "Business not verified"
 
-        # Load listing
-        box_value, box_exists = op.Box.get(op.itob(asset_id.native))
-        assert box_exists, "Listing not found"
-
-        seller          = Account(op.extract(box_value, 8,  32))
-        price           = op.btoi(op.extract(box_value, 40, 8))
-        expiry          = op.btoi(op.extract(box_value, 80, 8))   # ← NEW
-        active          = op.btoi(op.extract(box_value, 88, 8))
+        asset_id, seller, price = self._take_listing(listing_id.native, quantity.native)
+        held, new_claim = self._deliver(Txn.sender, asset_id, quantity.native)
+        self._emit_sold(listing_id.native, asset_id, seller, quantity.native, price, held)
 
-        assert active == UInt64(1), "Listing is not active"
-
-        # ── EXPIRY CHECK (enforced on-chain) ──────────────────────
-        # Global.latest_timestamp = current block time (cannot be faked)
-        assert Global.latest_timestamp < expiry, "This carbon credit has expired and cannot be sold"
+        deposit = self._claim_deposit() if new_claim else UInt64(0)
 
         # Verify payment
         pay = gtxn.PaymentTransaction(Txn.group_index - UInt64(1))
         assert pay.sender   == Txn.sender,                           "Payment sender mismatch"
         assert pay.receiver == Global.current_application_address,   "Wrong receiver"
-        assert pay.amount   == price,                                "Wrong payment amount"
+        assert pay.amount   == price + deposit,                      "Wrong payment amount"
 
         # Fee split
         platform_fee  = (price * self.platform_fee_bps.value) // UInt64(10000)
         seller_payout = price - platform_fee
 
-        # Pay seller
-        itxn.Payment(
-            receiver = seller,
-            amount   = seller_payout,
-            fee      = Global.min_txn_fee,
-        ).submit()
+        # Credit seller and platform — paid out on withdraw_proceeds()
+        self._accrue_proceeds(seller, seller_payout)
+        self._accrue_proceeds(self.admin.value, platform_fee)
 
-        # Pay platform fee
-        if platform_fee > UInt64(0):
-            itxn.Payment(
-                receiver = self.admin.value,
-                amount   = platform_fee,
-                fee      = Global.min_txn_fee,
-            ).submit()
+        self._add_credits_bought(Txn.sender, quantity.native)
+        self.total_volume_microalgo.value = self.total_volume_microalgo.value + price
+        self.total_trades.value           = self.total_trades.value + UInt64(1)
 
-        # Transfer NFT to buyer
-        itxn.AssetTransfer(
-            xfer_asset     = Asset(asset_id.native),
-            asset_receiver = Txn.sender,
-            asset_amount   = 1,
-            fee            = Global.min_txn_fee,
-        ).submit()
 
-        # Mark listing as sold (active = 0)
-        op.Box.put(
-            op.itob(asset_id.native),
-            op.extract(box_value, 0, 88) + op.itob(UInt64(0)),
-        )
+    @arc4.abimethod
+    def buy_credits(
+        self,
+        listing_ids: arc4.DynamicArray[arc4.UInt64],
+        quantities:  arc4.DynamicArray[arc4.UInt64],
+    ) -> None:
+        """
+        Verified business buys from several listings in one call.
+        quantities[i] units are bought from listing listing_ids[i], at
+        most MAX_BUY_BATCH listings.
 
-        self.total_credits_bought[Txn.sender]     = self.total_credits_bought[Txn.sender] + UInt64(1)
-        self.total_volume_microalgo.value          = self.total_volume_microalgo.value + price
-        self.total_trades.value                    = self.total_trades.value + UInt64(1)
+        Every listing goes through the same checks as buy_credit().
+        Sellers are credited per listing, the platform fee is credited
+        once and the marketplace stats are updated once for the whole batch.
 
+        Call as atomic group:
+            [0]  Payment  — buyer pays the sum of all purchase prices, plus a
+                            claim deposit per new claim box, to contract
+            [1]  AppCall  — this method
+            [2+] AppCall  — add_box_references(), up to 14, carrying the
+                            references of the listings that sell out (see
+                            MAX_BUY_BATCH); listings sharing a market or
+                            seller share those boxes
+        """
+        assert Txn.group_index > UInt64(0),                              "Must be in atomic group"
+        assert self._business_verified(Txn.sender),                      "Business not verified"
+        assert listing_ids.length > UInt64(0),                           "No listings given"
+        assert listing_ids.length <= UInt64(MAX_BUY_BATCH),              "Too many listings in one call"
+        assert quantities.length == listing_ids.length,                  "One quantity per listing"
 
-    # ─────────────────────────────────────────
-    #  CANCEL LISTING
-    # ─────────────────────────────────────────
+        total_price = UInt64(0)
+        total_fee   = UInt64(0)
+        total_units = UInt64(0)
+        deposits    = UInt64(0)
 
-    @arc4.abimethod
-    def cancel_listing(self, asset_id: arc4.UInt64) -> None:
-        """Seller cancels listing and gets NFT back."""
-        box_value, box_exists = op.Box.get(op.itob(asset_id.native))
-        assert box_exists, "Listing not found"
+        for i in urange(listing_ids.length):
+            quantity                = quantities[i].native
+            asset_id, seller, price = self._take_listing(listing_ids[i].native, quantity)
+            held, new_claim = self._deliver(Txn.sender, asset_id, quantity)
+            self._emit_sold(listing_ids[i].native, asset_id, seller, quantity, price, held)
 
-        seller = Account(op.extract(box_value, 8,  32))
-        active = op.btoi(op.extract(box_value, 88, 8))
+            platform_fee = (price * self.platform_fee_bps.value) // UInt64(10000)
+            self._accrue_proceeds(seller, price - platform_fee)
 
-        assert Txn.sender == seller, "Only seller can cancel"
-        assert active == UInt64(1),  "Listing not active"
+            total_price += price
+            total_fee   += platform_fee
+            total_units += quantity
+            if new_claim:
+                deposits += self._claim_deposit()
 
-        itxn.AssetTransfer(
-            xfer_asset     = Asset(asset_id.native),
-            asset_receiver = seller,
-            asset_amount   = 1,
-            fee            = Global.min_txn_fee,
-        ).submit()
+        # Verify the aggregated payment
+        pay = gtxn.PaymentTransaction(Txn.group_index - UInt64(1))
+        assert pay.sender   == Txn.sender,                           "Payment sender mismatch"
+        assert pay.receiver == Global.current_application_address,   "Wrong receiver"
+        assert pay.amount   == total_price + deposits,               "Wrong payment amount"
 
-        op.Box.put(
-            op.itob(asset_id.native),
-            op.extract(box_value, 0, 88) + op.itob(UInt64(0)),
-        )
+        # One ledger credit for the combined platform fee
+        self._accrue_proceeds(self.admin.value, total_fee)
+
+        self._add_credits_bought(Txn.sender, total_units)
+        self.total_volume_microalgo.value = self.total_volume_microalgo.value + total_price
+        self.total_trades.value           = self.total_trades.value + listing_ids.length
 
 
     # ─────────────────────────────────────────
-    #  READ ONLY
+    #  BUY AND RETIRE
     # ─────────────────────────────────────────
 
-    @arc4.abimethod(readonly=True)
-    def get_listing(
+    @arc4.abimethod
+    def buy_and_retire(
         self,
-        asset_id: arc4.UInt64,
-    ) -> tuple[arc4.Address, arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64]:
+        listing_id:       arc4.UInt64,
+        quantity:         arc4.UInt64,
+        company_name:     arc4.String,
+        ipfs_certificate: arc4.String,
+    ) -> arc4.UInt64:
         """
-        Get full listing details.
-        Returns: (seller, price_microalgo, co2_tonnes, min_purchase_qty, expiry_timestamp, active)
+        Verified business buys credits and retires them in the same group.
 
-        Frontend: use expiry_timestamp to show countdown timer
-        If current time > expiry_timestamp → show EXPIRED badge
-        """
-        box_value, box_exists = op.Box.get(op.itob(asset_id.native))
-        assert box_exists, "Listing not found"
+        Runs the buy_credit() checks and settlement, then the purchased
+        units go straight from the marketplace to the RetirementRegistry
+        set with set_retirement_registry(), which writes the certificate
+        for the buyer:
+            inner: registry.get_retirement_mbr(asset, buyer)
+            inner: registry.opt_in_asset(asset)
+            inner: Payment marketplace → registry, the certificate box MBR
+            inner: AssetTransfer marketplace → registry
+            inner: registry.retire_deposit(payment, transfer, buyer, company_name, ipfs_certificate)
 
-        return (
-            arc4.Address(op.extract(box_value, 8,  32)),
-            arc4.UInt64(op.btoi(op.extract(box_value, 40, 8))),
-            arc4.UInt64(op.btoi(op.extract(box_value, 48, 8))),
-            arc4.UInt64(op.btoi(op.extract(box_value, 64, 8))),
-            arc4.UInt64(op.btoi(op.extract(box_value, 80, 8))),
-            arc4.UInt64(op.btoi(op.extract(box_value, 88, 8))),
-        )
+        The registry computes the CO2 retired from the units it receives
+        and the issuance registry's kilograms per unit. The buyer pays the
+        MBR of the registry boxes the retirement creates on top of the
+        price; the marketplace forwards it unchanged.
 
+        Call as atomic group:
+            [0] Payment  — buyer pays quantity × unit price plus
+                           registry.get_retirement_mbr(asset, buyer)
+                           to contract
+            [1] AppCall  — this method; reference the registry and
+                           issuance apps, the asset, its creator, the
+                           issuance b"asset:" + itob(asset_id) box and
+                           the registry's certificate box itob(asset_id) (for a
+                           fungible tranche also itob(asset_id) | itob(n),
+                           n = next retirement number), its
+                           b"company_" + buyer totals box and its
+                           b"year_" + itob(current UTC year) bucket box
+            [2+] AppCall  — add_box_references(), for the references
+                           beyond this call's 8
 
-    @arc4.abimethod(readonly=True)
-    def is_listing_expired(self, asset_id: arc4.UInt64) -> arc4.Bool:
-        """
-        Check if a listing has expired.
-        Returns True if expired, False if still valid.
+        Returns: retirement timestamp from the registry (certificate reference)
         """
-        box_value, box_exists = op.Box.get(op.itob(asset_id.native))
-        assert box_exists, "Listing not found"
+        assert Txn.group_index > UInt64(0),                              "Must be in atomic group"
+        assert self._business_verified(Txn.sender),                      "Business not verified"
 
-        expiry = op.btoi(op.extract(box_value, 80, 8))
-        return arc4.Bool(Global.latest_timestamp > expiry)
+        registry = self.retirement_app.value
+        assert registry.id != UInt64(0),                                 "Retirement registry not set"
 
+        asset_id, seller, price = self._take_listing(listing_id.native, quantity.native)
+        self._emit_sold(listing_id.native, asset_id, seller, quantity.native, price, False)
 
-    @arc4.abimethod(readonly=True)
-    def get_business_status(
-        self,
-        business: arc4.Address,
-    ) -> tuple[arc4.UInt64, arc4.UInt64]:
-        """Returns (verified_status, total_credits_bought). Status: 0=pending, 1=verified, 2=rejected"""
-        return (
-            arc4.UInt64(self.business_verified[business.native]),
-            arc4.UInt64(self.total_credits_bought[business.native]),
+        asset = Asset(asset_id)
+        mbr, _call = arc4.abi_call[arc4.UInt64](
+            "get_retirement_mbr(asset,address)uint64",
+            asset,
+            arc4.Address(Txn.sender),
+            app_id = registry,
+            fee    = Global.min_txn_fee,
         )
 
+        pay = gtxn.PaymentTransaction(Txn.group_index - UInt64(1))
+        assert pay.sender   == Txn.sender,                           "Payment sender mismatch"
+        assert pay.receiver == Global.current_application_address,   "Wrong receiver"
+        assert pay.amount   == price + mbr.native,                   "Wrong payment amount"
 
-    @arc4.abimethod(readonly=True)
-    def get_stats(self) -> tuple[arc4.UInt64, arc4.UInt64]:
-        """Returns (total_volume_algo, total_trades)."""
-        return (
-            arc4.UInt64(self.total_volume_microalgo.value // UInt64(1_000_000)),
+        platform_fee = (price * self.platform_fee_bps.value) // UInt64(10000)
+        self._accrue_proceeds(seller, price - platform_fee)
+        self._accrue_proceeds(self.admin.value, platform_fee)
+
+        arc4.abi_call(
+            "opt_in_asset(asset)void",
+            asset,
+            app_id = registry,
+            fee    = Global.min_txn_fee,
+        )
+
+        mbr_payment = itxn.Payment(
+            receiver = registry.address,
+            amount   = mbr.native,
+            fee      = Global.min_txn_fee,
+        )
+        deposit = itxn.AssetTransfer(
+            xfer_asset     = asset,
+            asset_receiver = registry.address,
+            asset_amount   = quantity.native,
+            fee            = Global.min_txn_fee,
+        )
+        retire = itxn.ApplicationCall(
+            app_id   = registry,
+            app_args = (
+                arc4.arc4_signature("retire_deposit(pay,axfer,address,string,string)uint64"),
+                arc4.Address(Txn.sender),
+                company_name,
+                ipfs_certificate,
+            ),
+            assets   = (asset,),
+            accounts = (asset.creator,),
+            apps     = (self.issuance_app.value,),
+            fee      = Global.min_txn_fee,
+        )
+        _mbr_txn, _deposit_txn, retire_txn = itxn.submit_txns(mbr_payment, deposit, retire)
+
+        self._add_credits_bought(Txn.sender, quantity.native)
+        self.total_volume_microalgo.value = self.total_volume_microalgo.value + price
+        self.total_trades.value           = self.total_trades.value + UInt64(1)
+
+        return arc4.UInt64.from_log(retire_txn.last_log)
+
+
+    @subroutine
+    def _take_listing(self, listing_id: UInt64, quantity: UInt64) -> tuple[UInt64, Account, UInt64]:
+        """
+        Checks quantity units of a listing can be bought and books the sale;
+        the caller delivers the units and emits Sold. The remaining
+        quantity is updated in place, and the box is deleted once the
+        listing sells out.
+        Returns (asset_id, seller, total price).
+        """
+        listing = self._read_listing(listing_id)
+        assert listing.status == arc4.UInt8(LISTING_ACTIVE), "Listing is not active"
+
+        # ── EXPIRY CHECK (enforced on-chain) ──────────────────────
+        # Global.latest_timestamp = current block time (cannot be faked)
+        assert Global.latest_timestamp < listing.expiry.native, "This carbon credit has expired and cannot be sold"
+
+        available = listing.quantity.native
+        assert quantity > UInt64(0),   "Quantity must be > 0"
+        assert quantity <= available,  "Not enough units listed"
+        assert quantity >= listing.min_purchase_qty.native or quantity == available, "Below min purchase qty"
+
+        cost = listing.price.native * quantity
+        self._depth_trade(
+            self._depth_key(listing.market_id.native, listing.vintage_year.native),
+            listing.co2_kg.native * quantity,
+            cost,
+        )
+
+        if quantity == available:
+            # Sold out — reclaim the listing box (its CO2 already left the depth above)
+            listing.quantity = arc4.UInt64(0)
+            self._close_listing(listing_id, listing)
+        else:
+            op.Box.replace(self._listing_key(listing_id), LISTING_QUANTITY_OFFSET, op.itob(available - quantity))
+
+        return listing.asset_id.native, listing.seller.native, cost
+
+
+    @subroutine
+    def _emit_sold(
+        self,
+        listing_id: UInt64,
+        asset_id:   UInt64,
+        seller:     Account,
+        quantity:   UInt64,
+        cost:       UInt64,
+        held:       bool,
+    ) -> None:
+        """Emits Sold for units of a listing bought by the sender."""
+        arc4.emit(Sold(
+            listing_id = arc4.UInt64(listing_id),
+            asset_id   = arc4.UInt64(asset_id),
+            seller     = arc4.Address(seller),
+            buyer      = arc4.Address(Txn.sender),
+            quantity   = arc4.UInt64(quantity),
+            price      = arc4.UInt64(cost // quantity),
+            cost       = arc4.UInt64(cost),
+            held       = arc4.Bool(held),
+        ))
+
+
+    @subroutine
+    def _accrue_proceeds(self, account: Account, amount: UInt64) -> None:
+        """Adds amount to what the contract owes account."""
+        if amount == UInt64(0):
+            return
+
+        key = PROCEEDS_PREFIX + account.bytes
+        owed, owed_exists = op.Box.get(key)
+        balance = op.btoi(owed) if owed_exists else UInt64(0)
+        op.Box.put(key, op.itob(balance + amount))
+
+
+    # ─────────────────────────────────────────
+    #  WITHDRAW PROCEEDS
+    # ─────────────────────────────────────────
+
+    @arc4.abimethod
+    def withdraw_proceeds(self) -> arc4.UInt64:
+        """
+        Seller (or admin, for platform fees) collects everything owed
+        in a single payment. The ledger box is deleted to free its MBR.
+
+        Returns: amount paid out in microALGO
+        """
+        key = PROCEEDS_PREFIX + Txn.sender.bytes
+        owed, owed_exists = op.Box.get(key)
+        assert owed_exists, "Nothing to withdraw"
+
+        amount = op.btoi(owed)
+        op.Box.delete(key)
+
+        itxn.Payment(
+            receiver = Txn.sender,
+            amount   = amount,
+            fee      = Global.min_txn_fee,
+        ).submit()
+        arc4.emit(ProceedsWithdrawn(arc4.Address(Txn.sender), arc4.UInt64(amount)))
+
+        return arc4.UInt64(amount)
+
+
+    # ─────────────────────────────────────────
+    #  CANCEL LISTING
+    # ─────────────────────────────────────────
+
+    @arc4.abimethod
+    def cancel_listing(self, listing_id: arc4.UInt64) -> None:
+        """
+        Seller cancels listing and gets the unsold units back.
+
+        Call as atomic group:
+            [0]  AppCall  — this method
+            [1+] AppCall  — add_box_references(), up to 2: closing the
+                            listing needs up to CLOSE_REFERENCES + 2
+                            references (asset, seller proceeds box)
+        """
+        listing = self._read_listing(listing_id.native)
+
+        assert Txn.sender == listing.seller.native,             "Only seller can cancel"
+        assert listing.status == arc4.UInt8(LISTING_ACTIVE),    "Listing not active"
+
+        itxn.AssetTransfer(
+            xfer_asset     = Asset(listing.asset_id.native),
+            asset_receiver = Txn.sender,
+            asset_amount   = listing.quantity.native,
+            fee            = Global.min_txn_fee,
+        ).submit()
+
+        self._close_listing(listing_id.native, listing)
+        arc4.emit(Cancelled(listing_id, listing.asset_id, listing.seller.copy(), listing.quantity))
+
+
+    # ─────────────────────────────────────────
+    #  UPDATE LISTING
+    # ─────────────────────────────────────────
+
+    @arc4.abimethod
+    def update_listing(
+        self,
+        listing_id:  arc4.UInt64,
+        new_price:   arc4.UInt64,
+        new_min_qty: arc4.UInt64,
+    ) -> None:
+        """
+        Seller changes the unit price and minimum purchase quantity of an
+        active listing in place — no cancel/relist round trip.
+        """
+        self._update_listing(listing_id.native, new_price.native, new_min_qty.native)
+
+
+    @arc4.abimethod
+    def update_listings(
+        self,
+        listing_ids:  arc4.DynamicArray[arc4.UInt64],
+        new_prices:   arc4.DynamicArray[arc4.UInt64],
+        new_min_qtys: arc4.DynamicArray[arc4.UInt64],
+    ) -> None:
+        """
+        Seller reprices many listings in one call; arrays are parallel.
+        At most MAX_UPDATE_BATCH listings.
+        """
+        assert listing_ids.length  <= UInt64(MAX_UPDATE_BATCH), "Too many listings in one call"
+        assert new_prices.length   == listing_ids.length,       "One price per listing"
+        assert new_min_qtys.length == listing_ids.length,       "One min qty per listing"
+
+        for i in urange(listing_ids.length):
+            self._update_listing(listing_ids[i].native, new_prices[i].native, new_min_qtys[i].native)
+
+
+    @subroutine
+    def _update_listing(self, listing_id: UInt64, new_price: UInt64, new_min_qty: UInt64) -> None:
+        """Rewrites price/min_qty of one listing, keeping price index and depth in step."""
+        listing = self._read_listing(listing_id)
+
+        assert Txn.sender == listing.seller.native,             "Only seller can update"
+        assert listing.status == arc4.UInt8(LISTING_ACTIVE),    "Listing not active"
+        assert new_price > UInt64(0),                           "Price must be > 0"
+        assert new_min_qty > UInt64(0),                         "Min qty must be > 0"
+        assert new_min_qty <= listing.quantity.native,          "Min qty exceeds amount listed"
+
+        key       = self._listing_key(listing_id)
+        old_price = listing.price.native
+        if new_price != old_price:
+            market_id = listing.market_id.native
+            vintage   = listing.vintage_year.native
+
+            index_key = self._price_index_key(market_id, vintage)
+            self._index_remove(index_key, op.itob(old_price) + op.itob(listing_id))
+            self._index_insert(index_key, op.itob(new_price) + op.itob(listing_id))
+
+            depth_key = self._depth_key(market_id, vintage)
+            depth = self._read_depth(depth_key)
+            depth.price_sum = arc4.UInt64(depth.price_sum.native - old_price + new_price)
+            op.Box.put(depth_key, depth.bytes)
+
+            op.Box.replace(key, LISTING_PRICE_OFFSET, op.itob(new_price))
+
+        op.Box.replace(key, LISTING_MIN_QTY_OFFSET, op.itob(new_min_qty))
+        arc4.emit(Repriced(arc4.UInt64(listing_id), arc4.UInt64(new_price), arc4.UInt64(new_min_qty)))
+
+
+    @arc4.abimethod
+    def sweep_expired(self, listing_ids: arc4.DynamicArray[arc4.UInt64]) -> arc4.UInt64:
+        """
+        Anyone (e.g. a keeper bot) cleans up many listings in one call.
+
+        - Expired listings: unsold units go back to the seller, box deleted
+        - Missing or still-valid listings are skipped
+
+        Listings whose seller has opted out of the asset are skipped, since
+        the units cannot be returned; the seller can opt back in and retry.
+        At most MAX_SWEEP_BATCH listing ids.
+
+        Call as atomic group:
+            [0]  AppCall  — this method
+            [1+] AppCall  — add_box_references(), up to 15, carrying the
+                            references of the listings closed (see
+                            MAX_SWEEP_BATCH)
+
+        Returns: number of listing boxes deleted
+        """
+        assert listing_ids.length <= UInt64(MAX_SWEEP_BATCH), "Too many listings in one call"
+
+        swept = UInt64(0)
+        for listing_id in listing_ids:
+            _size, box_exists = op.Box.length(self._listing_key(listing_id.native))
+            if box_exists:
+                listing = self._read_listing(listing_id.native)
+                seller  = listing.seller.native
+                asset   = Asset(listing.asset_id.native)
+                if Global.latest_timestamp >= listing.expiry.native and seller.is_opted_in(asset):
+                    itxn.AssetTransfer(
+                        xfer_asset     = asset,
+                        asset_receiver = seller,
+                        asset_amount   = listing.quantity.native,
+                        fee            = Global.min_txn_fee,
+                    ).submit()
+                    self._close_listing(listing_id.native, listing)
+                    arc4.emit(Expired(listing_id, listing.asset_id, listing.seller.copy(), listing.quantity))
+                    swept += 1
+
+        return arc4.UInt64(swept)
+
+
+    # ─────────────────────────────────────────
+    #  LISTING STORAGE
+    # ─────────────────────────────────────────
+
+    @subroutine
+    def _credit_terms(self, asset_id: UInt64) -> tuple[UInt64, UInt64, UInt64, UInt64]:
+        """
+        (expiry, co2_kg per unit, vintage year, market id) of a
+        registry-minted credit, fetched from the issuance registry.
+        """
+        registry = self.issuance_app.value
+        assert registry.id != UInt64(0),                         "Issuance registry not set"
+        assert Asset(asset_id).creator == registry.address,      "Not an issued carbon credit"
+
+        terms, _call = arc4.abi_call[arc4.Tuple[arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64]](
+            "get_credit_terms(uint64)(uint64,uint64,uint64,uint64)",
+            arc4.UInt64(asset_id),
+            app_id = registry,
+            fee    = Global.min_txn_fee,
+        )
+        return terms[0].native, terms[1].native, terms[2].native, terms[3].native
+
+
+    @subroutine
+    def _pack_listing(
+        self,
+        status:           UInt64,
+        vintage_year:     UInt64,
+        listed_at:        UInt64,
+        expiry:           UInt64,
+        market_id:        UInt64,
+        asset_id:         UInt64,
+        seller:           Account,
+        price:            UInt64,
+        co2_kg:           UInt64,
+        min_purchase_qty: UInt64,
+        quantity:         UInt64,
+    ) -> Listing:
+        """Builds a current-version Listing, checking fields fit their slots."""
+        assert vintage_year <= UInt64(0xFFFF),    "Vintage year out of range"
+        assert listed_at    <= UInt64(0xFFFFFFFF), "Timestamp out of range"
+        assert expiry       <= UInt64(0xFFFFFFFF), "Expiry out of range"
+
+        return Listing(
+            version          = arc4.UInt8(LISTING_VERSION),
+            status           = arc4.UInt8(status),
+            vintage_year     = arc4.UInt16(vintage_year),
+            listed_at        = arc4.UInt32(listed_at),
+            expiry           = arc4.UInt32(expiry),
+            market_id        = arc4.UInt64(market_id),
+            asset_id         = arc4.UInt64(asset_id),
+            seller           = arc4.Address(seller),
+            price            = arc4.UInt64(price),
+            co2_kg           = arc4.UInt64(co2_kg),
+            min_purchase_qty = arc4.UInt64(min_purchase_qty),
+            quantity         = arc4.UInt64(quantity),
+            seller_slot      = arc4.UInt16(0),    # assigned by _open_listing
+            list_slot        = arc4.UInt32(0),    # assigned by _open_listing
+        )
+
+
+    @subroutine
+    def _listing_key(self, listing_id: UInt64) -> Bytes:
+        return LISTING_PREFIX + op.itob(listing_id)
+
+
+    @subroutine
+    def _read_listing(self, listing_id: UInt64) -> Listing:
+        box_value, box_exists = op.Box.get(self._listing_key(listing_id))
+        assert box_exists, "Listing not found"
+        return Listing.from_bytes(box_value)
+
+
+    @subroutine
+    def _open_listing(self, listing_id: UInt64, listing: Listing) -> None:
+        """Stores a new active listing and adds it to the indexes and market depth."""
+        seller_slot = self._seller_index_add(listing.seller.native, listing_id)
+        listing.seller_slot = arc4.UInt16(seller_slot)
+        listing.list_slot   = arc4.UInt32(self._active_set_add(listing_id))
+        op.Box.put(self._listing_key(listing_id), listing.bytes)
+        self._index_insert(
+            self._price_index_key(listing.market_id.native, listing.vintage_year.native),
+            op.itob(listing.price.native) + op.itob(listing_id),
+        )
+
+        depth_key = self._depth_key(listing.market_id.native, listing.vintage_year.native)
+        depth = self._read_depth(depth_key)
+        depth.active_listings = arc4.UInt64(depth.active_listings.native + UInt64(1))
+        depth.kg_on_offer     = arc4.UInt64(depth.kg_on_offer.native + listing.co2_kg.native * listing.quantity.native)
+        depth.price_sum       = arc4.UInt64(depth.price_sum.native + listing.price.native)
+        op.Box.put(depth_key, depth.bytes)
+
+
+    @subroutine
+    def _close_listing(self, listing_id: UInt64, listing: Listing) -> None:
+        """
+        Removes a sold, cancelled or expired listing and credits its box
+        deposit to the seller's proceeds.
+        """
+        op.Box.delete(self._listing_key(listing_id))
+        self._accrue_proceeds(listing.seller.native, self._listing_deposit())
+        self._seller_index_remove(listing.seller.native, listing.seller_slot.native)
+        self._active_set_remove(listing.list_slot.native)
+        self._index_remove(
+            self._price_index_key(listing.market_id.native, listing.vintage_year.native),
+            op.itob(listing.price.native) + op.itob(listing_id),
+        )
+
+        depth_key = self._depth_key(listing.market_id.native, listing.vintage_year.native)
+        depth = self._read_depth(depth_key)
+        depth.active_listings = arc4.UInt64(depth.active_listings.native - UInt64(1))
+        depth.kg_on_offer     = arc4.UInt64(depth.kg_on_offer.native - listing.co2_kg.native * listing.quantity.native)
+        depth.price_sum       = arc4.UInt64(depth.price_sum.native - listing.price.native)
+        op.Box.put(depth_key, depth.bytes)
+
+
+    # ─────────────────────────────────────────
+    #  ACTIVE LISTING SET
+    # ─────────────────────────────────────────
+
+    @subroutine
+    def _active_set_add(self, listing_id: UInt64) -> UInt64:
+        """Appends listing_id to the active listing set. Returns its slot."""
+        slot = self.active_listing_count.value
+        key  = ACTIVE_PAGE_PREFIX + op.itob(slot // UInt64(ACTIVE_PAGE_SIZE))
+        pos  = (slot % UInt64(ACTIVE_PAGE_SIZE)) * UInt64(8)
+
+        if pos == UInt64(0):
+            op.Box.create(key, UInt64(8))
+        else:
+            op.Box.resize(key, pos + UInt64(8))
+        op.Box.replace(key, pos, op.itob(listing_id))
+
+        self.active_listing_count.value = slot + UInt64(1)
+        return slot
+
+
+    @subroutine
+    def _active_set_remove(self, slot: UInt64) -> None:
+        """Swap-removes slot, re-pointing the listing moved into it."""
+        last     = self.active_listing_count.value - UInt64(1)
+        last_key = ACTIVE_PAGE_PREFIX + op.itob(last // UInt64(ACTIVE_PAGE_SIZE))
+        last_pos = (last % UInt64(ACTIVE_PAGE_SIZE)) * UInt64(8)
+
+        if slot != last:
+            moved = op.Box.extract(last_key, last_pos, UInt64(8))
+            op.Box.replace(
+                ACTIVE_PAGE_PREFIX + op.itob(slot // UInt64(ACTIVE_PAGE_SIZE)),
+                (slot % UInt64(ACTIVE_PAGE_SIZE)) * UInt64(8),
+                moved,
+            )
+            op.Box.replace(LISTING_PREFIX + moved, LISTING_LIST_SLOT_OFFSET, op.extract(op.itob(slot), 4, 4))
+
+        if last_pos == UInt64(0):
+            op.Box.delete(last_key)
+        else:
+            op.Box.resize(last_key, last_pos)
+
+        self.active_listing_count.value = last
+
+
+    # ─────────────────────────────────────────
+    #  MARKET DEPTH
+    # ─────────────────────────────────────────
+
+    @subroutine
+    def _depth_key(self, market_id: UInt64, vintage_year: UInt64) -> Bytes:
+        return DEPTH_PREFIX + self._market_key(market_id, vintage_year)
+
+
+    @subroutine
+    def _read_depth(self, key: Bytes) -> MarketDepth:
+        box_value, box_exists = op.Box.get(key)
+        if box_exists:
+            return MarketDepth.from_bytes(box_value)
+        return MarketDepth(
+            active_listings = arc4.UInt64(0),
+            kg_on_offer     = arc4.UInt64(0),
+            price_sum       = arc4.UInt64(0),
+            traded_volume   = arc4.UInt64(0),
+            trade_count     = arc4.UInt64(0),
+        )
+
+
+    @subroutine
+    def _depth_trade(self, key: Bytes, kg_sold: UInt64, cost: UInt64) -> None:
+        """Records one trade; kg_sold is the CO2 that left an open listing's offer."""
+        depth = self._read_depth(key)
+        depth.kg_on_offer     = arc4.UInt64(depth.kg_on_offer.native - kg_sold)
+        depth.traded_volume   = arc4.UInt64(depth.traded_volume.native + cost)
+        depth.trade_count     = arc4.UInt64(depth.trade_count.native + UInt64(1))
+        op.Box.put(key, depth.bytes)
+
+
+    # ─────────────────────────────────────────
+    #  SELLER INDEX
+    # ─────────────────────────────────────────
+
+    @subroutine
+    def _seller_index_add(self, seller: Account, listing_id: UInt64) -> UInt64:
+        """Appends listing_id to the seller's index. Returns its slot."""
+        key = SELLER_INDEX_PREFIX + seller.bytes
+        size, box_exists = op.Box.length(key)
+        if box_exists:
+            assert size < UInt64(SELLER_INDEX_CAPACITY * 8), "Seller listing limit reached"
+            op.Box.resize(key, size + UInt64(8))
+        else:
+            op.Box.create(key, UInt64(8))
+
+        op.Box.replace(key, size, op.itob(listing_id))
+        return size // UInt64(8)
+
+
+    @subroutine
+    def _seller_index_remove(self, seller: Account, slot: UInt64) -> None:
+        """Swap-removes the entry at slot, re-pointing the listing moved into it."""
+        key = SELLER_INDEX_PREFIX + seller.bytes
+        size, _exists = op.Box.length(key)
+        last = size - UInt64(8)
+
+        if size == UInt64(8):
+            op.Box.delete(key)
+            return
+
+        if slot * UInt64(8) != last:
+            moved = op.Box.extract(key, last, UInt64(8))
+            op.Box.replace(key, slot * UInt64(8), moved)
+            op.Box.replace(LISTING_PREFIX + moved, LISTING_SELLER_SLOT_OFFSET, op.extract(op.itob(slot), 6, 2))
+        op.Box.resize(key, last)
+
+
+    # ─────────────────────────────────────────
+    #  PRICE INDEX
+    # ─────────────────────────────────────────
+
+    @subroutine
+    def _market_id(self, project_type: Bytes) -> UInt64:
+        """Fixed-size id for a project type string (first 8 bytes of its sha256), as the issuance registry stores it."""
+        return op.btoi(op.extract(op.sha256(project_type), 0, 8))
+
+
+    @subroutine
+    def _market_key(self, market_id: UInt64, vintage_year: UInt64) -> Bytes:
+        """market_id(8) | vintage(2) — shared suffix of per-market box keys."""
+        return op.itob(market_id) + op.extract(op.itob(vintage_year), 6, 2)
+
+
+    @subroutine
+    def _price_index_key(self, market_id: UInt64, vintage_year: UInt64) -> Bytes:
+        return PRICE_INDEX_PREFIX + self._market_key(market_id, vintage_year)
+
+
+    @subroutine
+    def _index_search(self, key: Bytes, count: UInt64, entry: Bytes) -> UInt64:
+        """Binary search: first slot whose entry is >= entry."""
+        target = BigUInt.from_bytes(entry)
+        low    = UInt64(0)
+        high   = count
+        while low < high:
+            mid = (low + high) // UInt64(2)
+            probe = op.Box.extract(key, mid * UInt64(INDEX_ENTRY_SIZE), UInt64(INDEX_ENTRY_SIZE))
+            if BigUInt.from_bytes(probe) < target:
+                low = mid + UInt64(1)
+            else:
+                high = mid
+        return low
+
+
+    @subroutine
+    def _index_insert(self, key: Bytes, entry: Bytes) -> None:
+        """
+        Inserts entry in sorted position. A full index keeps only its
+        INDEX_CAPACITY lowest entries: the highest one is dropped, or the
+        new one if it sorts last. Dropped entries are not restored when
+        the index shrinks again (see best_offers). The bid book checks
+        capacity up front, so it never drops an entry.
+        """
+        size, box_exists = op.Box.length(key)
+        count = size // UInt64(INDEX_ENTRY_SIZE)
+        slot  = self._index_search(key, count, entry)
+
+        if count >= UInt64(INDEX_CAPACITY):
+            if slot >= count:
+                return
+        elif box_exists:
+            op.Box.resize(key, size + UInt64(INDEX_ENTRY_SIZE))
+        else:
+            op.Box.create(key, UInt64(INDEX_ENTRY_SIZE))
+
+        # splice keeps the box length: entries after slot shift right and
+        # the (empty or evicted) last entry falls off the end
+        op.Box.splice(key, slot * UInt64(INDEX_ENTRY_SIZE), UInt64(0), entry)
+
+
+    @subroutine
+    def _index_remove(self, key: Bytes, entry: Bytes) -> None:
+        """Removes entry if present; evicted entries are skipped."""
+        size, box_exists = op.Box.length(key)
+        if not box_exists:
+            return
+
+        count = size // UInt64(INDEX_ENTRY_SIZE)
+        slot  = self._index_search(key, count, entry)
+        if slot >= count:
+            return
+        if op.Box.extract(key, slot * UInt64(INDEX_ENTRY_SIZE), UInt64(INDEX_ENTRY_SIZE)) != entry:
+            return
+
+        if count == UInt64(1):
+            op.Box.delete(key)
+        else:
+            op.Box.splice(key, slot * UInt64(INDEX_ENTRY_SIZE), UInt64(INDEX_ENTRY_SIZE), Bytes())
+            op.Box.resize(key, size - UInt64(INDEX_ENTRY_SIZE))
+
+
+    # ─────────────────────────────────────────
+    #  STANDING BIDS
+    # ─────────────────────────────────────────
+
+    @arc4.abimethod
+    def place_bid(
+        self,
+        project_type:    arc4.String,
+        max_vintage_age: arc4.UInt64,
+        max_price:       arc4.UInt64,
+        qty:             arc4.UInt64,
+    ) -> arc4.UInt64:
+        """
+        Verified business places a standing buy order for a project type.
+
+        Matched automatically when a credit is listed: the listing's
+        project type must match, its vintage must be at most
+        max_vintage_age years old and its unit price at most max_price.
+        Fills happen at the listing price; the unused part of the escrow
+        is credited back through the proceeds ledger, together with the
+        box deposit once the bid is filled.
+
+        The deposit (see get_deposits) covers the bid box, its bid book
+        entry and one claim box, for units a fill holds because the
+        bidder is not opted in to the asset. Once that claim deposit is
+        used, fills that would need another new claim box skip the bid.
+
+        Call as atomic group:
+            [0] Payment  — buyer escrows max_price × qty plus the bid and
+                           claim deposits to contract
+            [1] AppCall  — this method
+
+        Returns: bid id
+        """
+        assert Txn.group_index > UInt64(0),                              "Must be in atomic group"
+        assert self._business_verified(Txn.sender),                      "Business not verified"
+        assert max_price.native > UInt64(0),                             "Price must be > 0"
+        assert qty.native > UInt64(0),                                   "Qty must be > 0"
+        assert max_vintage_age.native <= UInt64(0xFFFF),                 "Vintage age out of range"
+
+        escrow = max_price.native * qty.native + self._bid_deposit() + self._claim_deposit()
+        pay    = gtxn.PaymentTransaction(Txn.group_index - UInt64(1))
+        assert pay.sender   == Txn.sender,                           "Payment sender mismatch"
+        assert pay.receiver == Global.current_application_address,   "Wrong receiver"
+        assert pay.amount   == escrow,                               "Wrong escrow amount"
+
+        market_id = self._market_id(project_type.bytes)
+        book      = BID_BOOK_PREFIX + op.itob(market_id)
+        size, _exists = op.Box.length(book)
+        assert size // UInt64(INDEX_ENTRY_SIZE) < UInt64(INDEX_CAPACITY), "Bid book full"
+
+        bid_id = self.next_bid_id.value
+        self.next_bid_id.value = bid_id + UInt64(1)
+
+        op.Box.put(
+            BID_PREFIX + op.itob(bid_id),
+            Bid(
+                bidder          = arc4.Address(Txn.sender),
+                market_id       = arc4.UInt64(market_id),
+                max_vintage_age = arc4.UInt16(max_vintage_age.native),
+                max_price       = max_price,
+                quantity        = qty,
+                claim_deposit   = arc4.UInt64(self._claim_deposit()),
+            ).bytes,
+        )
+        self._index_insert(book, op.itob(~max_price.native) + op.itob(bid_id))
+        arc4.emit(BidPlaced(
+            bid_id          = arc4.UInt64(bid_id),
+            bidder          = arc4.Address(Txn.sender),
+            market_id       = arc4.UInt64(market_id),
+            max_vintage_age = arc4.UInt16(max_vintage_age.native),
+            max_price       = max_price,
+            quantity        = qty,
+        ))
+
+        return arc4.UInt64(bid_id)
+
+
+    @arc4.abimethod
+    def cancel_bid(self, bid_id: arc4.UInt64) -> None:
+        """Bidder cancels an open bid and gets the remaining escrow and its deposit back."""
+        bid = self._read_bid(bid_id.native)
+        assert Txn.sender == bid.bidder.native, "Only bidder can cancel"
+
+        op.Box.delete(BID_PREFIX + op.itob(bid_id.native))
+        self._index_remove(
+            BID_BOOK_PREFIX + op.itob(bid.market_id.native),
+            op.itob(~bid.max_price.native) + op.itob(bid_id.native),
+        )
+
+        refund = (
+            bid.max_price.native * bid.quantity.native
+            + self._bid_deposit()
+            + bid.claim_deposit.native
+        )
+        itxn.Payment(
+            receiver = Txn.sender,
+            amount   = refund,
+            fee      = Global.min_txn_fee,
+        ).submit()
+        arc4.emit(BidCancelled(bid_id, bid.bidder.copy(), arc4.UInt64(refund)))
+
+
+    @arc4.abimethod
+    def claim_credits(self, asset_id: arc4.UInt64) -> arc4.UInt64:
+        """
+        Collects units bought (directly or by a bid) while the buyer was
+        not opted in to the asset, and the claim deposit paid for the box.
+        Opt in first, then call this.
+
+        Returns: units transferred
+        """
+        key = CLAIM_PREFIX + Txn.sender.bytes + op.itob(asset_id.native)
+        owed, owed_exists = op.Box.get(key)
+        assert owed_exists, "Nothing to claim"
+
+        amount = op.btoi(owed)
+        op.Box.delete(key)
+
+        itxn.AssetTransfer(
+            xfer_asset     = Asset(asset_id.native),
+            asset_receiver = Txn.sender,
+            asset_amount   = amount,
+            fee            = Global.min_txn_fee,
+        ).submit()
+        itxn.Payment(
+            receiver = Txn.sender,
+            amount   = self._claim_deposit(),
+            fee      = Global.min_txn_fee,
+        ).submit()
+        arc4.emit(CreditsClaimed(arc4.Address(Txn.sender), asset_id, arc4.UInt64(amount)))
+
+        return arc4.UInt64(amount)
+
+
+    @subroutine
+    def _match_bids(self, listing_id: UInt64, listing: Listing, max_fills: UInt64) -> tuple[UInt64, UInt64]:
+        """
+        Fills standing bids for the listing's project type, best bid first,
+        at the listing's price. Looks at most MAX_BID_SCAN bids and fills
+        at most max_fills of them.
+        Returns (quantity left over for the listing itself, bids filled).
+        """
+        book = BID_BOOK_PREFIX + op.itob(listing.market_id.native)
+        size, _exists = op.Box.length(book)
+        count = size // UInt64(INDEX_ENTRY_SIZE)
+
+        asset_id    = listing.asset_id.native
+        seller      = listing.seller.native
+        price       = listing.price.native
+        min_qty     = listing.min_purchase_qty.native
+        vintage_age = self._vintage_age(listing.vintage_year.native)
+        remaining   = listing.quantity.native
+
+        slot    = UInt64(0)
+        scanned = UInt64(0)
+        fills   = UInt64(0)
+        while slot < count and scanned < UInt64(MAX_BID_SCAN) and fills < max_fills and remaining > UInt64(0):
+            scanned += 1
+            entry     = op.Box.extract(book, slot * UInt64(INDEX_ENTRY_SIZE), UInt64(INDEX_ENTRY_SIZE))
+            bid_price = ~op.btoi(op.extract(entry, 0, 8))
+            if bid_price < price:
+                break   # book is best-first: no later bid can pay the ask
+
+            bid_id  = op.btoi(op.extract(entry, 8, 8))
+            bid     = self._read_bid(bid_id)
+            bidder  = bid.bidder.native
+            bid_qty = bid.quantity.native
+            fill    = bid_qty if bid_qty < remaining else remaining
+
+            if (
+                vintage_age <= bid.max_vintage_age.native
+                and (fill >= min_qty or fill == remaining)
+                and self._business_verified(bidder)
+                and self._can_hold(bidder, bid.claim_deposit.native, asset_id)
+            ):
+                cost         = price * fill
+                platform_fee = (cost * self.platform_fee_bps.value) // UInt64(10000)
+                self._accrue_proceeds(seller, cost - platform_fee)
+                self._accrue_proceeds(self.admin.value, platform_fee)
+                # Escrow was taken at the bid price — credit back the difference
+                self._accrue_proceeds(bidder, (bid_price - price) * fill)
+                held, new_claim = self._deliver(bidder, asset_id, fill)
+                claim_deposit   = UInt64(0) if new_claim else bid.claim_deposit.native
+                fills += 1
+
+                self._add_credits_bought(bidder, fill)
+                self.total_volume_microalgo.value = self.total_volume_microalgo.value + cost
+                self.total_trades.value           = self.total_trades.value + UInt64(1)
+                # Filled before being listed, so no CO2 leaves the offer
+                self._depth_trade(
+                    self._depth_key(listing.market_id.native, listing.vintage_year.native),
+                    UInt64(0),
+                    cost,
+                )
+                arc4.emit(BidFilled(
+                    bid_id     = arc4.UInt64(bid_id),
+                    listing_id = arc4.UInt64(listing_id),
+                    asset_id   = listing.asset_id,
+                    bidder     = bid.bidder.copy(),
+                    quantity   = arc4.UInt64(fill),
+                    price      = listing.price,
+                    remaining  = arc4.UInt64(bid_qty - fill),
+                    held       = arc4.Bool(held),
+                ))
+
+                remaining -= fill
+                if fill == bid_qty:
+                    # Bid filled — the next bid moves into this slot
+                    op.Box.delete(BID_PREFIX + op.itob(bid_id))
+                    self._index_remove(book, entry)
+                    self._accrue_proceeds(bidder, self._bid_deposit() + claim_deposit)
+                    count -= 1
+                else:
+                    bid_key = BID_PREFIX + op.itob(bid_id)
+                    op.Box.replace(bid_key, BID_QUANTITY_OFFSET, op.itob(bid_qty - fill))
+                    op.Box.replace(bid_key, BID_CLAIM_DEPOSIT_OFFSET, op.itob(claim_deposit))
+                    slot += 1
+            else:
+                slot += 1
+
+        return remaining, fills
+
+
+    @subroutine
+    def _deliver(self, receiver: Account, asset_id: UInt64, amount: UInt64) -> tuple[bool, bool]:
+        """
+        Sends units to receiver, or records a claim if it is not opted in.
+        Returns (units held for claim_credits(), a new claim box was
+        created); the caller collects the claim deposit for a new box.
+        """
+        if receiver.is_opted_in(Asset(asset_id)):
+            itxn.AssetTransfer(
+                xfer_asset     = Asset(asset_id),
+                asset_receiver = receiver,
+                asset_amount   = amount,
+                fee            = Global.min_txn_fee,
+            ).submit()
+            return False, False
+
+        key = CLAIM_PREFIX + receiver.bytes + op.itob(asset_id)
+        owed, owed_exists = op.Box.get(key)
+        balance = op.btoi(owed) if owed_exists else UInt64(0)
+        op.Box.put(key, op.itob(balance + amount))
+        return True, not owed_exists
+
+
+    @subroutine
+    def _can_hold(self, bidder: Account, claim_deposit: UInt64, asset_id: UInt64) -> bool:
+        """False if a fill would open a new claim box the bid's spent claim deposit cannot pay for."""
+        if bidder.is_opted_in(Asset(asset_id)) or claim_deposit > UInt64(0):
+            return True
+        _size, owed_exists = op.Box.length(CLAIM_PREFIX + bidder.bytes + op.itob(asset_id))
+        return owed_exists
+
+
+    @subroutine
+    def _read_bid(self, bid_id: UInt64) -> Bid:
+        box_value, box_exists = op.Box.get(BID_PREFIX + op.itob(bid_id))
+        assert box_exists, "Bid not found"
+        return Bid.from_bytes(box_value)
+
+
+    @subroutine
+    def _vintage_age(self, vintage_year: UInt64) -> UInt64:
+        """Whole years since vintage_year, using the issuance registry's year length."""
+        SECONDS_PER_YEAR = UInt64(31_536_000)
+        BASE_2000_UNIX   = UInt64(946_684_800)
+
+        current_year = UInt64(2000) + (Global.latest_timestamp - BASE_2000_UNIX) // SECONDS_PER_YEAR
+        return current_year - vintage_year if current_year > vintage_year else UInt64(0)
+
+
+    # ─────────────────────────────────────────
+    #  READ ONLY
+    # ─────────────────────────────────────────
+
+    @arc4.abimethod(readonly=True)
+    def get_listing(
+        self,
+        listing_id: arc4.UInt64,
+    ) -> tuple[arc4.Address, arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64]:
+        """
+        Get full listing details.
+        Returns: (seller, price_microalgo, co2_kg, min_purchase_qty, expiry_timestamp, active,
+                  quantity_remaining, asset_id)
+
+        price_microalgo and co2_kg are per unit.
+
+        Frontend: use expiry_timestamp to show countdown timer
+        If current time >= expiry_timestamp → show EXPIRED badge
+        """
+        listing = self._read_listing(listing_id.native)
+
+        return (
+            listing.seller.copy(),
+            listing.price,
+            listing.co2_kg,
+            listing.min_purchase_qty,
+            arc4.UInt64(listing.expiry.native),
+            arc4.UInt64(listing.status.native),
+            listing.quantity,
+            listing.asset_id,
+        )
+
+
+    @arc4.abimethod(readonly=True)
+    def is_listing_expired(self, listing_id: arc4.UInt64) -> arc4.Bool:
+        """
+        Check if a listing has expired.
+        Returns True if expired, False if still valid. A listing expires
+        at its expiry timestamp: from then on buy_credit() rejects it.
+        """
+        listing = self._read_listing(listing_id.native)
+        return arc4.Bool(Global.latest_timestamp >= listing.expiry.native)
+
+
+    @arc4.abimethod(readonly=True)
+    def best_offers(
+        self,
+        project_type: arc4.String,
+        vintage_year: arc4.UInt64,
+        n:            arc4.UInt64,
+    ) -> arc4.DynamicArray[Offer]:
+        """
+        Cheapest active, unexpired listings for a (project_type, vintage) market.
+        Returns up to n (max 32) entries of (listing_id, asset_id, price), cheapest first.
+
+        Reads only the market's price index box plus the listing boxes it
+        returns — no scan of the full listing set.
+
+        The index holds at most INDEX_CAPACITY (256) entries per market.
+        Once it is full, listing a cheaper credit evicts the most expensive
+        entry, and an evicted listing is not re-added when others close, so
+        in a market with more than 256 listings some active listings (never
+        the cheapest 256 at insert time) are missing here; enumerate them
+        with get_listings_page(). Expired entries are skipped, so fewer than
+        n offers can come back while cheaper-but-expired listings await
+        sweep_expired().
+        """
+        assert n.native <= UInt64(MAX_BEST_OFFERS), "Max 32 offers per call"
+
+        offers = arc4.DynamicArray[Offer]()
+        key    = self._price_index_key(self._market_id(project_type.bytes), vintage_year.native)
+        size, _exists = op.Box.length(key)
+        count  = size // UInt64(INDEX_ENTRY_SIZE)
+
+        slot = UInt64(0)
+        while slot < count and offers.length < n.native:
+            entry      = op.Box.extract(key, slot * UInt64(INDEX_ENTRY_SIZE), UInt64(INDEX_ENTRY_SIZE))
+            listing_id = op.btoi(op.extract(entry, 8, 8))
+            listing    = self._read_listing(listing_id)
+            if Global.latest_timestamp < listing.expiry.native:
+                offers.append(Offer(
+                    listing_id = arc4.UInt64(listing_id),
+                    asset_id   = listing.asset_id,
+                    price      = arc4.UInt64(op.btoi(op.extract(entry, 0, 8))),
+                ))
+            slot += 1
+
+        return offers
+
+
+    @arc4.abimethod(readonly=True)
+    def get_bid(self, bid_id: arc4.UInt64) -> Bid:
+        """
+        Returns an open bid: (bidder, market_id, max_vintage_age, max_price,
+        quantity_remaining, unspent claim_deposit).
+        """
+        return self._read_bid(bid_id.native)
+
+
+    @arc4.abimethod(readonly=True)
+    def get_seller_listings(
+        self,
+        seller: arc4.Address,
+        offset: arc4.UInt64,
+        limit:  arc4.UInt64,
+    ) -> tuple[arc4.UInt64, arc4.DynamicArray[arc4.UInt64]]:
+        """
+        Listing IDs of a seller's active listings, read from the seller index.
+        Returns: (total_active_listings, listing_ids[offset : offset + limit])
+
+        limit is capped at 120 so the result fits one ABI return value;
+        page through larger portfolios with offset.
+        """
+        assert limit.native <= UInt64(MAX_SELLER_PAGE), "Max 120 listings per call"
+
+        key = SELLER_INDEX_PREFIX + seller.bytes
+        size, _exists = op.Box.length(key)
+        total = size // UInt64(8)
+        start = offset.native if offset.native < total else total
+        count = total - start
+        if count > limit.native:
+            count = limit.native
+
+        page = Bytes()
+        if count > UInt64(0):
+            page = op.Box.extract(key, start * UInt64(8), count * UInt64(8))
+
+        return (
+            arc4.UInt64(total),
+            arc4.DynamicArray[arc4.UInt64].from_bytes(op.extract(op.itob(count), 6, 2) + page),
+        )
+
+
+    @arc4.abimethod(readonly=True)
+    def get_market_depth(self, project_type: arc4.String, vintage_year: arc4.UInt64) -> MarketDepth:
+        """
+        Aggregates for a (project_type, vintage) market, kept up to date on
+        every listing, trade, cancel and sweep.
+        Returns: (active_listings, kg_on_offer, price_sum, traded_volume_microalgo, trade_count)
+        """
+        return self._read_depth(self._depth_key(self._market_id(project_type.bytes), vintage_year.native))
+
+
+    @arc4.abimethod(readonly=True)
+    def get_listings_page(
+        self,
+        offset: arc4.UInt64,
+        limit:  arc4.UInt64,
+    ) -> tuple[arc4.UInt64, arc4.DynamicArray[ListingView]]:
+        """
+        Pages through all active listings without an indexer.
+        Returns: (total_active_listings, listings[offset : offset + limit])
+
+        limit is capped at 11 so the page fits one ABI return value.
+        Order is stable between changes but not sorted: closing a listing
+        moves the last listing into its place.
+        """
+        assert limit.native <= UInt64(MAX_LISTINGS_PAGE), "Max 11 listings per call"
+
+        total = self.active_listing_count.value
+        end   = offset.native + limit.native
+        if end > total:
+            end = total
+
+        page = arc4.DynamicArray[ListingView]()
+        slot = offset.native
+        while slot < end:
+            listing_id = op.btoi(op.Box.extract(
+                ACTIVE_PAGE_PREFIX + op.itob(slot // UInt64(ACTIVE_PAGE_SIZE)),
+                (slot % UInt64(ACTIVE_PAGE_SIZE)) * UInt64(8),
+                UInt64(8),
+            ))
+            page.append(self._listing_view(listing_id, self._read_listing(listing_id)))
+            slot += 1
+
+        return arc4.UInt64(total), page
+
+
+    @arc4.abimethod(readonly=True)
+    def get_listings(
+        self,
+        listing_ids: arc4.DynamicArray[arc4.UInt64],
+    ) -> arc4.DynamicArray[ListingLookup]:
+        """
+        Bulk get_listing()/is_listing_expired(): one entry per listing ID,
+        in order. Missing listings come back with found=False instead of
+        failing the call. At most 11 IDs so the result fits one ABI return.
+        """
+        assert listing_ids.length <= UInt64(MAX_LISTINGS_PAGE), "Max 11 listings per call"
+
+        results = arc4.DynamicArray[ListingLookup]()
+        for listing_id in listing_ids:
+            _size, listed = op.Box.length(self._listing_key(listing_id.native))
+            if listed:
+                listing = self._read_listing(listing_id.native)
+                results.append(ListingLookup(
+                    found   = arc4.Bool(True),
+                    expired = arc4.Bool(Global.latest_timestamp >= listing.expiry.native),
+                    listing = self._listing_view(listing_id.native, listing),
+                ))
+            else:
+                results.append(ListingLookup.from_bytes(op.bzero(LISTING_LOOKUP_SIZE)))
+
+        return results
+
+
+    @subroutine
+    def _listing_view(self, listing_id: UInt64, listing: Listing) -> ListingView:
+        return ListingView(
+            listing_id       = arc4.UInt64(listing_id),
+            asset_id         = listing.asset_id,
+            seller           = listing.seller.copy(),
+            price            = listing.price,
+            co2_kg           = listing.co2_kg,
+            min_purchase_qty = listing.min_purchase_qty,
+            quantity         = listing.quantity,
+            vintage_year     = listing.vintage_year,
+            expiry           = listing.expiry,
+        )
+
+
+    @arc4.abimethod(readonly=True)
+    def get_proceeds(self, account: arc4.Address) -> arc4.UInt64:
+        """Returns microALGO owed to account, claimable via withdraw_proceeds()."""
+        owed, owed_exists = op.Box.get(PROCEEDS_PREFIX + account.bytes)
+        return arc4.UInt64(op.btoi(owed) if owed_exists else UInt64(0))
+
+
+    @arc4.abimethod(readonly=True)
+    def get_business_status(
+        self,
+        business: arc4.Address,
+    ) -> tuple[arc4.UInt64, arc4.UInt64]:
+        """
+        Returns (verified_status, total_credits_bought). Status: 0=pending, 1=verified, 2=rejected
+        Unregistered businesses read as (0, 0).
+        """
+        record, registered = op.Box.get(BUSINESS_PREFIX + business.bytes)
+        if not registered:
+            return arc4.UInt64(0), arc4.UInt64(0)
+        return (
+            arc4.UInt64(op.btoi(op.extract(record, 0, 1))),
+            arc4.UInt64(op.btoi(op.extract(record, BUSINESS_BOUGHT_OFFSET, 8))),
+        )
+
+
+    @arc4.abimethod(readonly=True)
+    def get_business_statuses(
+        self,
+        businesses: arc4.DynamicArray[arc4.Address],
+    ) -> arc4.DynamicArray[BusinessLookup]:
+        """
+        Bulk get_business_status(): one entry per address, in order, with
+        found=False for unregistered addresses. At most MAX_STATUS_LOOKUP.
+        """
+        assert businesses.length <= UInt64(MAX_STATUS_LOOKUP), "Too many businesses in one call"
+
+        results = arc4.DynamicArray[BusinessLookup]()
+        for business in businesses:
+            key = BUSINESS_PREFIX + business.bytes
+            _size, registered = op.Box.length(key)
+            if registered:
+                results.append(BusinessLookup(
+                    found          = arc4.Bool(True),
+                    status         = arc4.UInt8(op.btoi(op.Box.extract(key, 0, 1))),
+                    credits_bought = arc4.UInt64(op.btoi(op.Box.extract(key, BUSINESS_BOUGHT_OFFSET, 8))),
+                ))
+            else:
+                results.append(BusinessLookup(
+                    found          = arc4.Bool(False),
+                    status         = arc4.UInt8(0),
+                    credits_bought = arc4.UInt64(0),
+                ))
+
+        return results
+
+
+    @arc4.abimethod(readonly=True)
+    def get_business(self, business: arc4.Address) -> Business:
+        """Returns the full business record (status, credits_bought, name, country)."""
+        record, registered = op.Box.get(BUSINESS_PREFIX + business.bytes)
+        assert registered, "Business not registered"
+        return Business.from_bytes(record)
+
+
+    @arc4.abimethod(readonly=True)
+    def get_stats(self) -> tuple[arc4.UInt64, arc4.UInt64]:
+        """Returns (total_volume_algo, total_trades)."""
+        return (
+            arc4.UInt64(self.total_volume_microalgo.value // UInt64(1_000_000)),
             arc4.UInt64(self.total_trades.value),
-        )
\ No newline at end of file
+        )
+
+    @arc4.abimethod(readonly=True)
+    def get_deposits(self) -> tuple[arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64]:
+        """
+        Returns the box deposits in microALGO: (listing, bid, claim,
+        depth). A bid pays bid + claim; the first listing of a market
+        also pays depth.
+        """
+        return (
+            arc4.UInt64(self._listing_deposit()),
+            arc4.UInt64(self._bid_deposit()),
+            arc4.UInt64(self._claim_deposit()),
+            arc4.UInt64(self._box_mbr(UInt64(len(DEPTH_PREFIX) + 10 + DEPTH_SIZE))),
+        )
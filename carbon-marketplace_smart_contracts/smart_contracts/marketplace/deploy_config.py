@@ -1,4 +1,5 @@
 import logging
+import os
 from algokit_utils import (
     AlgorandClient,
     AlgoAmount,
@@ -46,4 +47,21 @@ def deploy() -> None:
         receiver=app_address,
         amount=AlgoAmount.from_algo(2),  # marketplace needs more for swaps
     )
-    logger.info("   Funded with 2 ALGO for inner transactions")
\ No newline at end of file
+    logger.info("   Funded with 2 ALGO for inner transactions")
+
+    # Listings read credit terms from the issuance registry and
+    # buy_and_retire() deposits into the retirement registry; deploy those
+    # first and pass their app IDs in ISSUANCE_APP_ID / RETIREMENT_APP_ID.
+    issuance_app_id = int(os.environ.get("ISSUANCE_APP_ID", "0"))
+    if issuance_app_id:
+        result.send.set_issuance_registry(args=(issuance_app_id,))
+        logger.info(f"   Issuance registry set to {issuance_app_id}")
+    else:
+        logger.warning("   ISSUANCE_APP_ID not set — listing fails until set_issuance_registry() is called")
+
+    retirement_app_id = int(os.environ.get("RETIREMENT_APP_ID", "0"))
+    if retirement_app_id:
+        result.send.set_retirement_registry(args=(retirement_app_id,))
+        logger.info(f"   Retirement registry set to {retirement_app_id}")
+    else:
+        logger.warning("   RETIREMENT_APP_ID not set — buy_and_retire fails until set_retirement_registry() is called")
\ No newline at end of file
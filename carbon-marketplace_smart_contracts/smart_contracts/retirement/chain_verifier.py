@@ -0,0 +1,136 @@
+"""
+Off-chain verifier for the RetirementRegistry certificate hash chain.
+
+The registry folds every certificate box it writes into a running hash:
+
+    head_0 = 32 zero bytes
+    head_n = sha256(head_{n-1} | itob(len(key)) | key | value)
+
+and stores n, the certificate's sequence number, at offset 88 of its
+value. Given the on-chain (chain_head, chain_length) — one read of global state
+or get_chain_head() — and an export of the registry's boxes, an auditor
+can rebuild the head locally and so confirm the history is complete and
+unaltered without trusting the indexer or the box listing.
+
+Usage:
+    from algosdk.v2client import algod
+    from smart_contracts.retirement.chain_verifier import (
+        fetch_boxes, fetch_head, verify_history,
+    )
+
+    client = algod.AlgodClient("", "https://testnet-api.algonode.cloud")
+    head, length = fetch_head(client, app_id)
+    assert verify_history(fetch_boxes(client, app_id), head, length)
+"""
+
+import base64
+import hashlib
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+GENESIS          = bytes(32)
+BATCH_PREFIX     = b"batch_"
+CERTIFICATE_SIZE = 96
+SEQUENCE_OFFSET  = 88
+
+
+@dataclass(frozen=True)
+class InclusionProof:
+    """Proves certificate `index` (from 1) is part of the chain ending at a head."""
+    index:     int
+    previous:  bytes                            # head_{index-1}
+    key:       bytes
+    value:     bytes
+    following: tuple[tuple[bytes, bytes], ...]  # certificates index+1..n
+
+
+def link(head: bytes, key: bytes, value: bytes) -> bytes:
+    """One step of the chain, exactly as RetirementRegistry._write_certificate()."""
+    return hashlib.sha256(head + len(key).to_bytes(8, "big") + key + value).digest()
+
+
+def rebuild_head(certificates: Iterable[tuple[bytes, bytes]], head: bytes = GENESIS) -> bytes:
+    """Folds (key, value) certificates, in chain order, into a head."""
+    for key, value in certificates:
+        head = link(head, key, value)
+    return head
+
+
+def is_certificate(key: bytes, value: bytes) -> bool:
+    """
+    True for certificate boxes: single and tranche certificates (8- and
+    16-byte keys, 96-byte values) and batch certificates. Batch pointers,
+    tranche counters and the company and year totals are not chained.
+    """
+    if key.startswith(BATCH_PREFIX):
+        return True
+    return len(key) in (8, 16) and len(value) == CERTIFICATE_SIZE
+
+
+def sequence(value: bytes) -> int:
+    """The chain sequence number stored in a certificate."""
+    return int.from_bytes(value[SEQUENCE_OFFSET : SEQUENCE_OFFSET + 8], "big")
+
+
+def order_certificates(boxes: Mapping[bytes, bytes], length: int) -> list[tuple[bytes, bytes]]:
+    """
+    Puts exported certificate boxes in chain order by their sequence number.
+    Raises KeyError if any of the sequence numbers 1..length is missing.
+    """
+    by_sequence = {
+        sequence(value): (key, value)
+        for key, value in boxes.items()
+        if is_certificate(key, value)
+    }
+    return [by_sequence[n] for n in range(1, length + 1)]
+
+
+def verify_history(boxes: Mapping[bytes, bytes], head: bytes, length: int) -> bool:
+    """True if the exported boxes rebuild exactly the on-chain head."""
+    try:
+        certificates = order_certificates(boxes, length)
+    except KeyError:
+        return False
+    return rebuild_head(certificates) == head
+
+
+def inclusion_proof(certificates: list[tuple[bytes, bytes]], index: int) -> InclusionProof:
+    """Builds the proof for certificate `index` (from 1) of an ordered history."""
+    key, value = certificates[index - 1]
+    return InclusionProof(
+        index     = index,
+        previous  = rebuild_head(certificates[: index - 1]),
+        key       = key,
+        value     = value,
+        following = tuple(certificates[index:]),
+    )
+
+
+def verify_inclusion(proof: InclusionProof, head: bytes, length: int) -> bool:
+    """True if the proven certificate sits at proof.index of the chain ending at head."""
+    if proof.index + len(proof.following) != length:
+        return False
+    return rebuild_head(proof.following, link(proof.previous, proof.key, proof.value)) == head
+
+
+# ── algod helpers ──────────────────────────────────────────────
+
+def fetch_head(client, app_id: int) -> tuple[bytes, int]:
+    """Reads (chain_head, chain_length) from the registry's global state."""
+    state = {
+        base64.b64decode(entry["key"]): entry["value"]
+        for entry in client.application_info(app_id)["params"].get("global-state", [])
+    }
+    return (
+        base64.b64decode(state[b"chain_head"]["bytes"]),
+        state[b"chain_length"]["uint"],
+    )
+
+
+def fetch_boxes(client, app_id: int) -> dict[bytes, bytes]:
+    """Exports every box of the registry as {name: value}."""
+    boxes = {}
+    for box in client.application_boxes(app_id)["boxes"]:
+        name = base64.b64decode(box["name"])
+        boxes[name] = base64.b64decode(client.application_box_by_name(app_id, name)["value"])
+    return boxes
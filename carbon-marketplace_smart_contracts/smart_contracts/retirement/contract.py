@@ -1,37 +1,157 @@
+import typing
+
 from algopy import (
     ARC4Contract,
+    Application,
     Asset,
     GlobalState,
     UInt64,
+    Bytes,
     Account,
     Txn,
     Global,
     arc4,
     itxn,
     op,
+    gtxn,
+    subroutine,
+    urange,
 )
 
 
+# Certificates: 96 bytes, keyed itob(asset_id) for a single-unit credit.
+# CO2 is recorded in kilograms, so parts of a decimals=3 tranche (one unit
+# per kilogram) retire exactly.
+# Fungible tranches (asset total > 1) are retired in parts: itob(asset_id)
+# then holds the number of retirements(8) and certificate n (from 1) is
+# keyed itob(asset_id) | itob(n).
+CERTIFICATE_SIZE = 96
+
+# Batch retirements (retire_credits) write one aggregated certificate,
+# prefix | batch_id(8) → company(32) | co2_kg(8) | count(8) |
+# timestamp(8) | txn_id(32) | sequence(8) | asset_id(8) × count, and a 16-byte pointer
+# itob(asset_id) → batch_id(8) | co2_kg(8) per retired credit.
+BATCH_PREFIX     = b"batch_"
+BATCH_HEADER     = 96
+POINTER_SIZE     = 16
+MAX_RETIRE_BATCH = 11   # opt-in + MBR payment + 11 deposits + call + 2 padding calls = 16 txns
+
+# Asset IDs per verify_retirements() call, so the result fits one ABI return
+MAX_VERIFY_LOOKUP = 20
+
+# Per-company running totals, updated by every retirement path:
+# prefix | company(32) → co2_kg(8) | retirements(8) | first_time(8) | last_time(8)
+COMPANY_PREFIX      = b"company_"
+COMPANY_TOTALS_SIZE = 32
+
+# Monthly retirement buckets: one box per UTC year, prefix | itob(year) →
+# 12 × (co2_kg(8) | retirements(8)), January first. Months are
+# passed around as YYYYMM integers.
+YEAR_PREFIX       = b"year_"
+MONTH_BUCKET_SIZE = 16
+MAX_SERIES_MONTHS = 36
+
+# Box minimum balance: flat + per byte of key and value. Every retirement
+# pays for the boxes it creates (see get_retirement_mbr) so the registry's
+# own balance only covers inner transaction fees.
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+
+# Certificate hash chain. Every certificate box (single, tranche or batch;
+# not the batch pointers) extends chain_head with
+#   chain_head = sha256(chain_head | itob(len(key)) | key | value)
+# starting from 32 zero bytes. Each certificate stores its chain sequence
+# number n (from 1) at offset 88, so the history can be replayed in order
+# from the certificates alone. See chain_verifier.py.
+
+
+class MonthTotals(arc4.Struct):
+    """One month of get_retirement_series()."""
+    month:       arc4.UInt32   # YYYYMM
+    co2_kg:      arc4.UInt64
+    retirements: arc4.UInt64
+
+
+# ─────────────────────────────────────────
+#  ARC-28 EVENTS
+# ─────────────────────────────────────────
+
+class Retired(arc4.Struct):
+    """
+    ARC-28 event: a credit (or part of a tranche) was retired.
+    sequence is the tranche certificate number, 0 for single-unit credits.
+    """
+    asset_id:   arc4.UInt64
+    company:    arc4.Address
+    co2_kg:     arc4.UInt64
+    sequence:   arc4.UInt64
+    retired_at: arc4.UInt64
+
+
+class BatchRetired(arc4.Struct):
+    """ARC-28 event: retire_credits() retired a batch of credits."""
+    batch_id:   arc4.UInt64
+    company:    arc4.Address
+    co2_kg:     arc4.UInt64
+    retired_at: arc4.UInt64
+    asset_ids:  arc4.DynamicArray[arc4.UInt64]
+
+
+class IssuanceRegistrySet(arc4.Struct):
+    """ARC-28 event: the admin pointed the registry at an issuance registry."""
+    registry: arc4.UInt64
+
+
+class RetirementRecord(arc4.Struct):
+    """One entry of verify_retirements(); found=False if there is no certificate."""
+    found:      arc4.Bool
+    company:    arc4.Address
+    co2_kg:     arc4.UInt64
+    retired_at: arc4.UInt64
+
+
 class RetirementRegistry(ARC4Contract):
     """
     Contract 3 — Retirement Registry
-    Companies permanently burn carbon credits as proof of offset.
+    Companies permanently retire carbon credits as proof of offset: the
+    units are sent here and closed out to the issuance registry, which
+    never re-issues them.
     Every retirement is recorded forever on-chain — cannot be undone.
     Anyone can verify a company's offset claims publicly.
     """
 
     def __init__(self) -> None:
-        self.admin                = GlobalState(Account)
-        self.total_tonnes_retired = GlobalState(UInt64)
-        self.total_retirements    = GlobalState(UInt64)
+        self.admin             = GlobalState(Account)
+        self.total_kg_retired  = GlobalState(UInt64)
+        self.total_retirements = GlobalState(UInt64)
+        self.next_batch_id     = GlobalState(UInt64)
+        self.chain_head        = GlobalState(Bytes)
+        self.chain_length      = GlobalState(UInt64)
+        self.issuance_app      = GlobalState(Application)
 
 
     @arc4.abimethod(allow_actions=["NoOp"], create="require")
     def create_registry(self) -> None:
         """Deploy the retirement registry. Caller becomes admin."""
-        self.admin.value                = Txn.sender
-        self.total_tonnes_retired.value = UInt64(0)
-        self.total_retirements.value    = UInt64(0)
+        self.admin.value             = Txn.sender
+        self.total_kg_retired.value  = UInt64(0)
+        self.total_retirements.value = UInt64(0)
+        self.next_batch_id.value     = UInt64(0)
+        self.chain_head.value        = op.bzero(32)
+        self.chain_length.value      = UInt64(0)
+        self.issuance_app.value      = Application(0)
+
+
+    @arc4.abimethod
+    def set_issuance_registry(self, registry: Application) -> None:
+        """
+        Admin points the registry at the CreditIssuanceRegistry.
+        retire_deposit() reads each credit's CO2 per unit from it, so
+        deposits cannot be retired until this is set.
+        """
+        assert Txn.sender == self.admin.value, "Admin only"
+        self.issuance_app.value = registry
+        arc4.emit(IssuanceRegistrySet(arc4.UInt64(registry.id)))
 
 
     @arc4.abimethod
@@ -39,61 +159,468 @@ class RetirementRegistry(ARC4Contract):
         self,
         asset_id:         arc4.UInt64,
         company_name:     arc4.String,
-        co2_tonnes:       arc4.UInt64,
         ipfs_certificate: arc4.String,
     ) -> arc4.UInt64:
         """
-        Permanently retire (burn) a carbon credit NFT.
+        Permanently retire a carbon credit NFT the sender holds.
 
         Steps:
-        1. Clawback NFT from the company's wallet → contract
-        2. Destroy the ASA forever (cannot be reversed)
-        3. Write retirement certificate to box storage
+        1. Company sends the NFT to the registry (preceding transaction)
+        2. Registry closes it out to the ASA creator, the issuance
+           registry, which never re-issues it (cannot be reversed)
+        3. Write retirement certificate to box storage (CO2 in kilograms,
+           read from the issuance registry as in retire_deposit())
+
+        Call as atomic group:
+            [0] AppCall       — opt_in_asset(asset)
+            [1] Payment       — the MBR of the new boxes to the registry,
+                                see get_retirement_mbr(asset, sender)
+            [2] AssetTransfer — company sends the NFT to the registry
+            [3] AppCall       — this method; reference the issuance app
+                                and its b"asset:" + itob(asset_id) box
 
         Returns: retirement timestamp (use as certificate reference ID)
         """
-        assert co2_tonnes.native > UInt64(0), "Invalid tonnes"
+        assert Txn.group_index > UInt64(1), "Must be in atomic group"
 
-        retirement_time = Global.latest_timestamp
+        asset   = Asset(asset_id.native)
+        deposit = gtxn.AssetTransferTransaction(Txn.group_index - UInt64(1))
+        assert deposit.xfer_asset == asset,                                   "Wrong asset deposited"
+        assert deposit.sender == Txn.sender,                                  "Deposit not from sender"
+        assert deposit.asset_receiver == Global.current_application_address,  "Credits must go to registry"
+        assert deposit.asset_amount == UInt64(1),                             "Deposit the one unit"
+        assert asset.total == UInt64(1),                                      "Tranche credits retire via retire_deposit"
 
-        # Step 1 — Clawback NFT from company wallet back to contract
-        itxn.AssetTransfer(
-            xfer_asset     = Asset(asset_id.native),
-            asset_sender   = Txn.sender,
-            asset_receiver = Global.current_application_address,
-            asset_amount   = 1,
-            fee            = Global.min_txn_fee,
-        ).submit()
+        _size, box_exists = op.Box.length(op.itob(asset_id.native))
+        assert not box_exists, "Credit already retired"
 
-        # Step 2 — Destroy the ASA permanently
-        # Calling AssetConfig with no fields = destroy
-        itxn.AssetConfig(
-            config_asset = Asset(asset_id.native),
-            fee          = Global.min_txn_fee,
-        ).submit()
+        self._check_mbr_payment(
+            gtxn.PaymentTransaction(Txn.group_index - UInt64(2)),
+            self._retirement_mbr(asset, Txn.sender),
+        )
+
+        retirement_time = Global.latest_timestamp
+        co2_kg          = self._co2_kg_per_unit(asset)
+
+        # Steps 1 & 2 — Take the NFT out of circulation and drop the opt-in
+        self._close_out(asset)
 
         # Step 3 — Write retirement record to box storage
         # Box key   = asset_id (8 bytes) — unique per credit
-        # Box value = asset_id(8) | company_address(32) | co2_tonnes(8) | timestamp(8) | txn_id(32)
-        # Total     = 88 bytes
-        op.Box.put(
+        # Box value = asset_id(8) | company_address(32) | co2_kg(8) | timestamp(8) | txn_id(32) | sequence(8)
+        # Total     = 96 bytes
+        self._write_certificate(
             op.itob(asset_id.native),
             op.itob(asset_id.native)   +   # offset 0  — 8 bytes
             Txn.sender.bytes           +   # offset 8  — 32 bytes  (company wallet)
-            op.itob(co2_tonnes.native) +   # offset 40 — 8 bytes
+            op.itob(co2_kg)            +   # offset 40 — 8 bytes
             op.itob(retirement_time)   +   # offset 48 — 8 bytes
             Txn.tx_id,                     # offset 56 — 32 bytes  (transaction proof)
+            Bytes(),
         )
 
-        # Update global stats
-        self.total_tonnes_retired.value = (
-            self.total_tonnes_retired.value + co2_tonnes.native
+        # Update company and global stats
+        self._record_company(Txn.sender, co2_kg, UInt64(1))
+        self._record_month(co2_kg, UInt64(1))
+        self.total_kg_retired.value  = self.total_kg_retired.value + co2_kg
+        self.total_retirements.value = self.total_retirements.value + UInt64(1)
+
+        arc4.emit(Retired(
+            asset_id   = asset_id,
+            company    = arc4.Address(Txn.sender),
+            co2_kg     = arc4.UInt64(co2_kg),
+            sequence   = arc4.UInt64(0),
+            retired_at = arc4.UInt64(retirement_time),
+        ))
+        return arc4.UInt64(retirement_time)
+
+
+    @arc4.abimethod
+    def retire_credits(
+        self,
+        asset_ids:        arc4.DynamicArray[arc4.UInt64],
+        company_name:     arc4.String,
+        ipfs_certificate: arc4.String,
+    ) -> arc4.UInt64:
+        """
+        Retire many single-unit carbon credits sent to the registry in one call.
+
+        Works like retire_deposit(): the sender deposits each credit, the
+        CO2 is read from the issuance registry and the unit is closed out
+        to its creator. Instead of one 96-byte certificate per credit a
+        single batch certificate lists them all, and each credit gets a
+        16-byte pointer to it so verify_retirement(asset_id) still works.
+
+        Call as atomic group:
+            [0]      AppCall       — opt_in_assets(asset_ids)
+            [1]      Payment       — the MBR of the new boxes to the registry:
+                                     n pointers, the batch certificate and,
+                                     if new, the company and year boxes
+            [2..n+1] AssetTransfer — sender sends 1 unit of asset_ids[i]
+                                     to the registry, in the same order
+            [n+2]    AppCall       — this method
+            [n+3..]  AppCall       — optional get_global_stats() calls,
+                                     only to carry box references
+
+        Reference the issuance app, and the boxes: b"asset:" + itob(asset_id)
+        on the issuance app and itob(asset_id) here for every credit, plus
+        BATCH_PREFIX + itob(batch_id), the company and year boxes. At
+        8 references per app call the 16-transaction group fits at most
+        MAX_RETIRE_BATCH credits. Fees cover two inner transactions per
+        credit.
+
+        Returns: batch id (look it up with get_batch)
+        """
+        count = asset_ids.length
+        assert count > UInt64(0),                          "No credits given"
+        assert count <= UInt64(MAX_RETIRE_BATCH),          "Too many credits in one call"
+        assert Txn.group_index > count,                    "Deposits must precede the call"
+
+        batch_id = self.next_batch_id.value
+        self.next_batch_id.value = batch_id + UInt64(1)
+
+        first = Txn.group_index - count
+        self._check_mbr_payment(
+            gtxn.PaymentTransaction(first - UInt64(1)),
+            count * self._box_mbr(UInt64(8 + POINTER_SIZE))
+            + self._box_mbr(UInt64(len(BATCH_PREFIX) + 8 + BATCH_HEADER) + count * UInt64(8))
+            + self._company_year_mbr(Txn.sender),
+        )
+
+        total_kg = UInt64(0)
+        retired  = Bytes()
+        for i in urange(count):
+            asset_id = asset_ids[i].native
+            deposit  = gtxn.AssetTransferTransaction(first + i)
+            asset    = deposit.xfer_asset
+            assert asset.id == asset_id,                                          "Deposit order mismatch"
+            assert deposit.sender == Txn.sender,                                  "Deposit not from sender"
+            assert deposit.asset_receiver == Global.current_application_address,  "Credits must go to registry"
+            assert deposit.asset_amount == UInt64(1),                             "Deposit one unit per credit"
+            assert asset.total == UInt64(1),                                      "Tranche credits retire via retire_deposit"
+
+            _size, box_exists = op.Box.length(op.itob(asset_id))
+            assert not box_exists, "Credit already retired"
+
+            co2_kg = self._co2_kg_per_unit(asset)
+
+            self._close_out(asset)
+            op.Box.put(op.itob(asset_id), op.itob(batch_id) + op.itob(co2_kg))
+
+            total_kg += co2_kg
+            retired  += op.itob(asset_id)
+
+        self._write_certificate(
+            BATCH_PREFIX + op.itob(batch_id),
+            Txn.sender.bytes                 +   # offset 0  — 32 bytes  (company wallet)
+            op.itob(total_kg)                +   # offset 32 — 8 bytes
+            op.itob(count)                   +   # offset 40 — 8 bytes
+            op.itob(Global.latest_timestamp) +   # offset 48 — 8 bytes
+            Txn.tx_id,                           # offset 56 — 32 bytes  (transaction proof)
+            retired,                             # offset 96 — 8 bytes × count
+        )
+
+        self._record_company(Txn.sender, total_kg, count)
+        self._record_month(total_kg, count)
+        self.total_kg_retired.value  = self.total_kg_retired.value + total_kg
+        self.total_retirements.value = self.total_retirements.value + count
+
+        arc4.emit(BatchRetired(
+            batch_id   = arc4.UInt64(batch_id),
+            company    = arc4.Address(Txn.sender),
+            co2_kg     = arc4.UInt64(total_kg),
+            retired_at = arc4.UInt64(Global.latest_timestamp),
+            asset_ids  = asset_ids.copy(),
+        ))
+        return arc4.UInt64(batch_id)
+
+
+    @subroutine
+    def _close_out(self, asset: Asset) -> None:
+        """
+        Takes deposited units out of circulation: closes the registry's
+        holding out to the asset creator, dropping the opt-in and its MBR,
+        and has the issuance registry record the lower remaining supply.
+        """
+        itxn.AssetTransfer(
+            xfer_asset     = asset,
+            asset_receiver = asset.creator,
+            asset_amount   = 0,
+            asset_close_to = asset.creator,
+            fee            = Global.min_txn_fee,
+        ).submit()
+
+        arc4.abi_call[arc4.UInt64](
+            "sync_supply(uint64)uint64",
+            arc4.UInt64(asset.id),
+            app_id = self.issuance_app.value,
+            assets = (asset,),
+            fee    = Global.min_txn_fee,
+        )
+
+
+    @subroutine
+    def _check_mbr_payment(self, pay: gtxn.PaymentTransaction, amount: UInt64) -> None:
+        """Asserts pay sends the registry exactly the MBR of the boxes about to be created."""
+        assert pay.receiver == Global.current_application_address,  "MBR must go to registry"
+        assert pay.amount   == amount,                               "Wrong MBR payment"
+
+
+    @subroutine
+    def _box_mbr(self, size: UInt64) -> UInt64:
+        """Minimum balance of a box with key and value totalling size bytes."""
+        return UInt64(BOX_FLAT_MIN_BALANCE) + UInt64(BOX_BYTE_MIN_BALANCE) * size
+
+
+    @subroutine
+    def _new_box_mbr(self, key: Bytes, size: UInt64) -> UInt64:
+        """Minimum balance of a size-byte box under key, or 0 if it already exists."""
+        _size, exists = op.Box.length(key)
+        if exists:
+            return UInt64(0)
+        return self._box_mbr(key.length + size)
+
+
+    @subroutine
+    def _company_year_mbr(self, company: Account) -> UInt64:
+        """MBR of the company totals and current year boxes a retirement would create."""
+        year, _month = self._civil_month(Global.latest_timestamp)
+        return (
+            self._new_box_mbr(COMPANY_PREFIX + company.bytes, UInt64(COMPANY_TOTALS_SIZE))
+            + self._new_box_mbr(YEAR_PREFIX + op.itob(year), UInt64(12 * MONTH_BUCKET_SIZE))
+        )
+
+
+    @subroutine
+    def _retirement_mbr(self, asset: Asset, beneficiary: Account) -> UInt64:
+        """MBR of every box one retirement of asset for beneficiary creates."""
+        key = op.itob(asset.id)
+        mbr = self._company_year_mbr(beneficiary)
+        if asset.total > UInt64(1):
+            count, counted = op.Box.get(key)
+            sequence = (op.btoi(count) if counted else UInt64(0)) + UInt64(1)
+            mbr += self._new_box_mbr(key, UInt64(8))
+            key  = key + op.itob(sequence)
+        return mbr + self._box_mbr(key.length + UInt64(CERTIFICATE_SIZE))
+
+
+    @subroutine
+    def _write_certificate(self, key: Bytes, fields: Bytes, asset_ids: Bytes) -> None:
+        """
+        Writes a certificate box — the 88 bytes of fields, the chain
+        sequence number (offset 88) and, for a batch, its asset IDs —
+        and appends it to the hash chain.
+        """
+        length      = self.chain_length.value + UInt64(1)
+        certificate = fields + op.itob(length) + asset_ids
+        op.Box.put(key, certificate)
+
+        self.chain_head.value   = op.sha256(self.chain_head.value + op.itob(key.length) + key + certificate)
+        self.chain_length.value = length
+
+
+    @subroutine
+    def _record_company(self, company: Account, co2_kg: UInt64, retirements: UInt64) -> None:
+        """Adds retirements to the company's running totals box."""
+        key = COMPANY_PREFIX + company.bytes
+        totals, exists = op.Box.get(key)
+        if exists:
+            op.Box.put(
+                key,
+                op.itob(op.btoi(op.extract(totals, 0, 8)) + co2_kg)      +
+                op.itob(op.btoi(op.extract(totals, 8, 8)) + retirements) +
+                op.extract(totals, 16, 8)                                +
+                op.itob(Global.latest_timestamp),
+            )
+        else:
+            op.Box.put(
+                key,
+                op.itob(co2_kg)                  +
+                op.itob(retirements)             +
+                op.itob(Global.latest_timestamp) +
+                op.itob(Global.latest_timestamp),
+            )
+
+
+    @subroutine
+    def _record_month(self, co2_kg: UInt64, retirements: UInt64) -> None:
+        """Adds retirements to the current UTC month's bucket."""
+        year, month = self._civil_month(Global.latest_timestamp)
+        key = YEAR_PREFIX + op.itob(year)
+        _size, exists = op.Box.length(key)
+        if not exists:
+            op.Box.create(key, UInt64(12 * MONTH_BUCKET_SIZE))
+
+        offset = (month - UInt64(1)) * UInt64(MONTH_BUCKET_SIZE)
+        bucket = op.Box.extract(key, offset, UInt64(MONTH_BUCKET_SIZE))
+        op.Box.replace(
+            key,
+            offset,
+            op.itob(op.btoi(op.extract(bucket, 0, 8)) + co2_kg) +
+            op.itob(op.btoi(op.extract(bucket, 8, 8)) + retirements),
+        )
+
+
+    @subroutine
+    def _civil_month(self, timestamp: UInt64) -> tuple[UInt64, UInt64]:
+        """(year, month) of a Unix timestamp in UTC — days-to-civil, proleptic Gregorian."""
+        z   = timestamp // UInt64(86_400) + UInt64(719_468)   # days since 0000-03-01
+        era = z // UInt64(146_097)
+        doe = z - era * UInt64(146_097)                        # day of 400-year era
+        yoe = (doe - doe // UInt64(1_460) + doe // UInt64(36_524) - doe // UInt64(146_096)) // UInt64(365)
+        doy = doe - (UInt64(365) * yoe + yoe // UInt64(4) - yoe // UInt64(100))
+        mp  = (UInt64(5) * doy + UInt64(2)) // UInt64(153)    # month from March = 0
+
+        year = yoe + era * UInt64(400)
+        if mp < UInt64(10):
+            return year, mp + UInt64(3)
+        return year + UInt64(1), mp - UInt64(9)
+
+
+    # ─────────────────────────────────────────
+    #  RETIRE BY DEPOSIT (buy-and-retire flow)
+    # ─────────────────────────────────────────
+
+    @arc4.abimethod
+    def opt_in_asset(self, asset: Asset) -> None:
+        """
+        Registry opts in to asset so it can receive a retirement deposit.
+        Anyone can call it for a credit of the issuance registry; the
+        opt-in is undone when the credit is retired.
+        """
+        self._opt_in(asset)
+
+
+    @arc4.abimethod
+    def opt_in_assets(self, asset_ids: arc4.DynamicArray[arc4.UInt64]) -> None:
+        """
+        opt_in_asset() for up to MAX_RETIRE_BATCH credits, so a
+        retire_credits() group needs a single opt-in call.
+        """
+        assert asset_ids.length <= UInt64(MAX_RETIRE_BATCH), "Too many credits in one call"
+        for asset_id in asset_ids:
+            self._opt_in(Asset(asset_id.native))
+
+
+    @subroutine
+    def _opt_in(self, asset: Asset) -> None:
+        """Opts the registry in to an issued credit unless it already is."""
+        assert asset.creator == self.issuance_app.value.address, "Not an issued carbon credit"
+        if not Global.current_application_address.is_opted_in(asset):
+            itxn.AssetTransfer(
+                xfer_asset     = asset,
+                asset_receiver = Global.current_application_address,
+                asset_amount   = 0,
+                fee            = Global.min_txn_fee,
+            ).submit()
+
+
+    @arc4.abimethod
+    def retire_deposit(
+        self,
+        mbr:              gtxn.PaymentTransaction,
+        deposit:          gtxn.AssetTransferTransaction,
+        beneficiary:      arc4.Address,
+        company_name:     arc4.String,
+        ipfs_certificate: arc4.String,
+    ) -> arc4.UInt64:
+        """
+        Retire credit units sent to the registry, on behalf of beneficiary.
+
+        Used by CarbonMarketplace.buy_and_retire() so a purchase and its
+        retirement land in one atomic group, but anyone holding a credit
+        can use it directly.
+
+        The CO2 retired is computed on-chain: deposited units × the
+        credit's kilograms per unit, read from the issuance registry with
+        an inner get_credit_terms() call (the asset must have been minted
+        by it). Reference the issuance app and its b"asset:" + itob(asset_id)
+        box.
+
+        The deposited units are closed out to the asset creator (the
+        issuance registry, which never re-issues them) so the registry
+        does not keep an opt-in or its MBR, and the issuance registry's
+        remaining supply is updated with an inner sync_supply() call.
+
+        A single-unit credit can be retired once. A fungible tranche can
+        be retired in any number of parts, each with its own certificate
+        (see verify_tranche_retirement); reference both certificate boxes.
+        Each retirement pays the MBR of the boxes it creates, which
+        get_retirement_mbr(asset, beneficiary) returns.
+
+        Call as atomic group:
+            [0] AppCall       — opt_in_asset(asset)
+            [1] Payment       — anyone pays the MBR to the registry
+            [2] AssetTransfer — holder sends the units to the registry
+            [3] AppCall       — this method
+
+        Returns: retirement timestamp (use as certificate reference ID)
+        """
+        assert deposit.asset_receiver == Global.current_application_address,  "Credits must go to registry"
+        assert deposit.asset_amount > UInt64(0),                              "Nothing deposited"
+
+        asset    = deposit.xfer_asset
+        asset_id = asset.id
+        co2_kg   = deposit.asset_amount * self._co2_kg_per_unit(asset)
+        self._check_mbr_payment(mbr, self._retirement_mbr(asset, beneficiary.native))
+
+        key      = op.itob(asset_id)
+        sequence = UInt64(0)
+        if asset.total > UInt64(1):
+            count, counted = op.Box.get(key)
+            sequence = (op.btoi(count) if counted else UInt64(0)) + UInt64(1)
+            op.Box.put(key, op.itob(sequence))
+            key = key + op.itob(sequence)
+        else:
+            _size, box_exists = op.Box.length(key)
+            assert not box_exists, "Credit already retired"
+
+        retirement_time = Global.latest_timestamp
+
+        self._close_out(asset)
+
+        # Same certificate layout as retire_credit()
+        self._write_certificate(
+            key,
+            op.itob(asset_id)          +   # offset 0  — 8 bytes
+            beneficiary.bytes          +   # offset 8  — 32 bytes  (company wallet)
+            op.itob(co2_kg)            +   # offset 40 — 8 bytes
+            op.itob(retirement_time)   +   # offset 48 — 8 bytes
+            Txn.tx_id,                     # offset 56 — 32 bytes  (transaction proof)
+            Bytes(),
         )
+
+        self._record_company(beneficiary.native, co2_kg, UInt64(1))
+        self._record_month(co2_kg, UInt64(1))
+        self.total_kg_retired.value  = self.total_kg_retired.value + co2_kg
         self.total_retirements.value = self.total_retirements.value + UInt64(1)
 
+        arc4.emit(Retired(
+            asset_id   = arc4.UInt64(asset_id),
+            company    = beneficiary.copy(),
+            co2_kg     = arc4.UInt64(co2_kg),
+            sequence   = arc4.UInt64(sequence),
+            retired_at = arc4.UInt64(retirement_time),
+        ))
         return arc4.UInt64(retirement_time)
 
 
+    @subroutine
+    def _co2_kg_per_unit(self, asset: Asset) -> UInt64:
+        """Kilograms of CO2 per base unit of a registry-minted credit."""
+        registry = self.issuance_app.value
+        assert registry.id != UInt64(0),            "Issuance registry not set"
+        assert asset.creator == registry.address,   "Not an issued carbon credit"
+
+        terms, _call = arc4.abi_call[arc4.Tuple[arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64]](
+            "get_credit_terms(uint64)(uint64,uint64,uint64,uint64)",
+            arc4.UInt64(asset.id),
+            app_id = registry,
+            fee    = Global.min_txn_fee,
+        )
+        return terms[1].native
+
+
     @arc4.abimethod(readonly=True)
     def verify_retirement(
         self,
@@ -103,11 +630,23 @@ class RetirementRegistry(ARC4Contract):
         Publicly verify a retirement by asset ID.
         Regulators and investors can call this to check offset claims.
 
-        Returns: (company_address, co2_tonnes, retirement_date_unix)
+        Credits retired in a batch are resolved through their pointer to
+        the batch certificate; reference that box too.
+
+        Returns: (company_address, co2_kg, retirement_date_unix)
         """
         box_value, box_exists = op.Box.get(op.itob(asset_id.native))
         assert box_exists, "Retirement certificate not found"
 
+        if box_value.length == UInt64(POINTER_SIZE):
+            batch = op.Box.extract(BATCH_PREFIX + op.extract(box_value, 0, 8), 0, BATCH_HEADER)
+            return (
+                arc4.Address(op.extract(batch, 0, 32)),
+                arc4.UInt64(op.btoi(op.extract(box_value, 8, 8))),
+                arc4.UInt64(op.btoi(op.extract(batch, 48, 8))),
+            )
+
+        assert box_value.length == UInt64(CERTIFICATE_SIZE), "Tranche credit: use verify_tranche_retirement"
         return (
             arc4.Address(op.extract(box_value, 8,  32)),
             arc4.UInt64(op.btoi(op.extract(box_value, 40, 8))),
@@ -115,10 +654,201 @@ class RetirementRegistry(ARC4Contract):
         )
 
 
+    @arc4.abimethod(readonly=True)
+    def verify_retirements(
+        self,
+        asset_ids: arc4.DynamicArray[arc4.UInt64],
+    ) -> arc4.DynamicArray[RetirementRecord]:
+        """
+        Bulk verify_retirement(): one entry per asset ID, in order. Credits
+        with no single or batch certificate — including fungible tranches,
+        see verify_tranche_retirement() — come back with found=False.
+        At most MAX_VERIFY_LOOKUP IDs.
+        """
+        assert asset_ids.length <= UInt64(MAX_VERIFY_LOOKUP), "Too many asset IDs in one call"
+
+        results = arc4.DynamicArray[RetirementRecord]()
+        for asset_id in asset_ids:
+            box_value, box_exists = op.Box.get(op.itob(asset_id.native))
+            if box_exists and box_value.length == UInt64(POINTER_SIZE):
+                batch = op.Box.extract(BATCH_PREFIX + op.extract(box_value, 0, 8), 0, BATCH_HEADER)
+                results.append(RetirementRecord(
+                    found      = arc4.Bool(True),
+                    company    = arc4.Address(op.extract(batch, 0, 32)),
+                    co2_kg     = arc4.UInt64(op.btoi(op.extract(box_value, 8, 8))),
+                    retired_at = arc4.UInt64(op.btoi(op.extract(batch, 48, 8))),
+                ))
+            elif box_exists and box_value.length == UInt64(CERTIFICATE_SIZE):
+                results.append(RetirementRecord(
+                    found      = arc4.Bool(True),
+                    company    = arc4.Address(op.extract(box_value, 8, 32)),
+                    co2_kg     = arc4.UInt64(op.btoi(op.extract(box_value, 40, 8))),
+                    retired_at = arc4.UInt64(op.btoi(op.extract(box_value, 48, 8))),
+                ))
+            else:
+                results.append(RetirementRecord(
+                    found      = arc4.Bool(False),
+                    company    = arc4.Address(),
+                    co2_kg     = arc4.UInt64(0),
+                    retired_at = arc4.UInt64(0),
+                ))
+
+        return results
+
+
+    @arc4.abimethod(readonly=True)
+    def verify_tranche_retirement(
+        self,
+        asset_id: arc4.UInt64,
+        sequence: arc4.UInt64,
+    ) -> tuple[arc4.Address, arc4.UInt64, arc4.UInt64]:
+        """
+        Same as verify_retirement() for the sequence-th retirement (from 1)
+        of a fungible tranche; see get_retirement_count().
+
+        Returns: (company_address, co2_kg, retirement_date_unix)
+        """
+        box_value, box_exists = op.Box.get(op.itob(asset_id.native) + op.itob(sequence.native))
+        assert box_exists, "Retirement certificate not found"
+
+        return (
+            arc4.Address(op.extract(box_value, 8,  32)),
+            arc4.UInt64(op.btoi(op.extract(box_value, 40, 8))),
+            arc4.UInt64(op.btoi(op.extract(box_value, 48, 8))),
+        )
+
+
+    @arc4.abimethod(readonly=True)
+    def get_retirement_mbr(self, asset: Asset, beneficiary: arc4.Address) -> arc4.UInt64:
+        """
+        Returns the MBR payment, in microALGO, that retiring asset for
+        beneficiary now (retire_credit or retire_deposit) must carry: the
+        certificate box, a tranche's retirement counter on its first
+        retirement, and the company and year boxes if they are new.
+        """
+        return arc4.UInt64(self._retirement_mbr(asset, beneficiary.native))
+
+
+    @arc4.abimethod(readonly=True)
+    def get_retirement_count(self, asset_id: arc4.UInt64) -> arc4.UInt64:
+        """Returns how many times a credit has been retired (0 or 1 for single-unit credits)."""
+        box_value, box_exists = op.Box.get(op.itob(asset_id.native))
+        if not box_exists:
+            return arc4.UInt64(0)
+        if box_value.length == UInt64(CERTIFICATE_SIZE) or box_value.length == UInt64(POINTER_SIZE):
+            return arc4.UInt64(1)
+        return arc4.UInt64(op.btoi(box_value))
+
+
+    @arc4.abimethod(readonly=True)
+    def get_batch(
+        self,
+        batch_id: arc4.UInt64,
+    ) -> tuple[arc4.Address, arc4.UInt64, arc4.UInt64, arc4.DynamicArray[arc4.UInt64]]:
+        """
+        Returns a batch certificate from retire_credits():
+        (company_address, total_co2_kg, retirement_date_unix, asset_ids)
+        """
+        box_value, box_exists = op.Box.get(BATCH_PREFIX + op.itob(batch_id.native))
+        assert box_exists, "Batch certificate not found"
+
+        count     = op.btoi(op.extract(box_value, 40, 8))
+        asset_ids = arc4.DynamicArray[arc4.UInt64]()
+        for i in urange(count):
+            asset_ids.append(arc4.UInt64(op.btoi(op.extract(box_value, UInt64(BATCH_HEADER) + i * UInt64(8), 8))))
+
+        return (
+            arc4.Address(op.extract(box_value, 0, 32)),
+            arc4.UInt64(op.btoi(op.extract(box_value, 32, 8))),
+            arc4.UInt64(op.btoi(op.extract(box_value, 48, 8))),
+            asset_ids,
+        )
+
+
+    @arc4.abimethod(readonly=True)
+    def get_company_totals(
+        self,
+        company: arc4.Address,
+    ) -> tuple[arc4.UInt64, arc4.UInt64, arc4.UInt64, arc4.UInt64]:
+        """
+        Returns (total_co2_kg, retirements, first_retirement_unix,
+        last_retirement_unix) for a company; all zero if it never retired.
+        Credits retired by deposit count for the beneficiary.
+        """
+        totals, exists = op.Box.get(COMPANY_PREFIX + company.bytes)
+        if not exists:
+            return arc4.UInt64(0), arc4.UInt64(0), arc4.UInt64(0), arc4.UInt64(0)
+        return (
+            arc4.UInt64(op.btoi(op.extract(totals, 0,  8))),
+            arc4.UInt64(op.btoi(op.extract(totals, 8,  8))),
+            arc4.UInt64(op.btoi(op.extract(totals, 16, 8))),
+            arc4.UInt64(op.btoi(op.extract(totals, 24, 8))),
+        )
+
+
+    @arc4.abimethod(readonly=True)
+    def get_chain_head(self) -> tuple[arc4.StaticArray[arc4.Byte, typing.Literal[32]], arc4.UInt64]:
+        """
+        Returns (chain_head, chain_length): the hash over every certificate
+        written so far, and how many there are. Auditors replay the
+        exported certificates against it with chain_verifier.py.
+        """
+        return (
+            arc4.StaticArray[arc4.Byte, typing.Literal[32]].from_bytes(self.chain_head.value),
+            arc4.UInt64(self.chain_length.value),
+        )
+
+
+    @arc4.abimethod(readonly=True)
+    def get_retirement_series(
+        self,
+        from_month: arc4.UInt32,
+        to_month:   arc4.UInt32,
+    ) -> arc4.DynamicArray[MonthTotals]:
+        """
+        Returns kilograms of CO2 and retirements per UTC month from from_month to
+        to_month inclusive (both YYYYMM, e.g. 202401), at most
+        MAX_SERIES_MONTHS. Months without retirements read as zero.
+        Reference the YEAR_PREFIX + itob(year) box of each year covered.
+        """
+        year  = from_month.native // UInt64(100)
+        month = from_month.native % UInt64(100)
+        end   = to_month.native
+        assert month >= UInt64(1) and month <= UInt64(12),                         "Invalid from_month"
+        assert end % UInt64(100) >= UInt64(1) and end % UInt64(100) <= UInt64(12), "Invalid to_month"
+        assert from_month.native <= end,                                           "Empty range"
+
+        series = arc4.DynamicArray[MonthTotals]()
+        while year * UInt64(100) + month <= end:
+            assert series.length < UInt64(MAX_SERIES_MONTHS), "Range too long"
+
+            buckets, exists = op.Box.get(YEAR_PREFIX + op.itob(year))
+            co2_kg      = UInt64(0)
+            retirements = UInt64(0)
+            if exists:
+                offset      = (month - UInt64(1)) * UInt64(MONTH_BUCKET_SIZE)
+                co2_kg      = op.btoi(op.extract(buckets, offset, 8))
+                retirements = op.btoi(op.extract(buckets, offset + UInt64(8), 8))
+
+            series.append(MonthTotals(
+                month       = arc4.UInt32(year * UInt64(100) + month),
+                co2_kg      = arc4.UInt64(co2_kg),
+                retirements = arc4.UInt64(retirements),
+            ))
+
+            if month == UInt64(12):
+                year  += 1
+                month  = UInt64(1)
+            else:
+                month += 1
+
+        return series
+
+
     @arc4.abimethod(readonly=True)
     def get_global_stats(self) -> tuple[arc4.UInt64, arc4.UInt64]:
-        """Returns (total_tonnes_retired, total_retirements)."""
+        """Returns (total_kg_retired, total_retirements)."""
         return (
-            arc4.UInt64(self.total_tonnes_retired.value),
+            arc4.UInt64(self.total_kg_retired.value),
             arc4.UInt64(self.total_retirements.value),
         )
\ No newline at end of file
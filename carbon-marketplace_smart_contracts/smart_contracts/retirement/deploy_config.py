@@ -1,4 +1,5 @@
 import logging
+import os
 from algokit_utils import (
     AlgorandClient,
     AlgoAmount,
@@ -35,11 +36,20 @@ def deploy() -> None:
     logger.info(f"   App Address : {app_address}")
     logger.info(f"   Explorer    : https://testnet.explorer.perawallet.app/application/{app_id}/")
 
-    # Fund for burn transactions
+    # Fund for inner transactions (close-outs, registry calls)
     algorand.send.payment(
         sender=deployer.address,
         signer=deployer.signer,
         receiver=app_address,
         amount=AlgoAmount.from_algo(1),
     )
-    logger.info("   Funded with 1 ALGO for burn transactions")
\ No newline at end of file
+    logger.info("   Funded with 1 ALGO for inner transactions")
+
+    # Retirements read CO2 per unit from the issuance registry; deploy it
+    # first and pass its app ID in ISSUANCE_APP_ID.
+    issuance_app_id = int(os.environ.get("ISSUANCE_APP_ID", "0"))
+    if issuance_app_id:
+        result.send.set_issuance_registry(args=(issuance_app_id,))
+        logger.info(f"   Issuance registry set to {issuance_app_id}")
+    else:
+        logger.warning("   ISSUANCE_APP_ID not set — retire_deposit fails until set_issuance_registry() is called")
\ No newline at end of file
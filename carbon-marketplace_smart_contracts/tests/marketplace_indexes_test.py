@@ -0,0 +1,214 @@
+from collections.abc import Iterator
+
+import pytest
+from algopy import Account, Bytes, UInt64, op
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+
+from smart_contracts.marketplace.contract import (
+    ACTIVE_PAGE_PREFIX,
+    DEPTH_PREFIX,
+    INDEX_CAPACITY,
+    INDEX_ENTRY_SIZE,
+    LISTING_ACTIVE,
+    LISTING_PREFIX,
+    LISTING_SIZE,
+    PRICE_INDEX_PREFIX,
+    PROCEEDS_PREFIX,
+    SELLER_INDEX_PREFIX,
+    CarbonMarketplace,
+    Listing,
+    MarketDepth,
+)
+
+INDEX_KEY = PRICE_INDEX_PREFIX + bytes(10)
+NOW       = 1_700_000_000
+EXPIRY    = 2_000_000_000
+
+# Market of the listings opened by open_listing(): market_id 7, vintage 2024
+MARKET_KEY   = (7).to_bytes(8, "big") + (2024).to_bytes(2, "big")
+MARKET_INDEX = PRICE_INDEX_PREFIX + MARKET_KEY
+MARKET_DEPTH = DEPTH_PREFIX + MARKET_KEY
+
+
+@pytest.fixture()
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture()
+def marketplace(context: AlgopyTestContext) -> Iterator[CarbonMarketplace]:
+    contract = CarbonMarketplace()
+    app = context.ledger.get_app(contract)
+    context.ledger.patch_global_fields(latest_timestamp=NOW)
+    with context.txn.create_group([context.any.txn.application_call(app_id=app)]):
+        contract.active_listing_count.value = UInt64(0)
+        yield contract
+
+
+def entry(price: int, listing_id: int) -> Bytes:
+    return op.itob(price) + op.itob(listing_id)
+
+
+def index_entries(context: AlgopyTestContext, contract: CarbonMarketplace, key: bytes) -> list[tuple[int, int]]:
+    if not context.ledger.box_exists(contract, key):
+        return []
+    value = context.ledger.get_box(contract, key)
+    return [
+        (int.from_bytes(value[i : i + 8], "big"), int.from_bytes(value[i + 8 : i + 16], "big"))
+        for i in range(0, len(value), INDEX_ENTRY_SIZE)
+    ]
+
+
+def open_listing(
+    contract: CarbonMarketplace, listing_id: int, seller: Account, price: int, quantity: int
+) -> Listing:
+    listing = contract._pack_listing(
+        UInt64(LISTING_ACTIVE),
+        UInt64(2024),
+        UInt64(NOW),
+        UInt64(EXPIRY),
+        UInt64(7),
+        UInt64(1000 + listing_id),
+        seller,
+        UInt64(price),
+        UInt64(1000),
+        UInt64(1),
+        UInt64(quantity),
+    )
+    contract._open_listing(UInt64(listing_id), listing)
+    return listing
+
+
+def stored_listing(context: AlgopyTestContext, contract: CarbonMarketplace, listing_id: int) -> Listing:
+    return Listing.from_bytes(context.ledger.get_box(contract, LISTING_PREFIX + listing_id.to_bytes(8, "big")))
+
+
+# ─────────────────────────────────────────
+#  SORTED INDEX
+# ─────────────────────────────────────────
+
+def test_index_insert_keeps_entries_sorted(context: AlgopyTestContext, marketplace: CarbonMarketplace) -> None:
+    for price, listing_id in [(30, 1), (10, 2), (20, 3), (10, 1)]:
+        marketplace._index_insert(Bytes(INDEX_KEY), entry(price, listing_id))
+
+    assert index_entries(context, marketplace, INDEX_KEY) == [(10, 1), (10, 2), (20, 3), (30, 1)]
+
+
+def test_index_remove_deletes_entry_and_empty_box(context: AlgopyTestContext, marketplace: CarbonMarketplace) -> None:
+    for price, listing_id in [(10, 1), (20, 2), (30, 3)]:
+        marketplace._index_insert(Bytes(INDEX_KEY), entry(price, listing_id))
+
+    marketplace._index_remove(Bytes(INDEX_KEY), entry(20, 2))
+    assert index_entries(context, marketplace, INDEX_KEY) == [(10, 1), (30, 3)]
+
+    # Missing entries are ignored
+    marketplace._index_remove(Bytes(INDEX_KEY), entry(20, 2))
+    marketplace._index_remove(Bytes(INDEX_KEY), entry(99, 9))
+    assert index_entries(context, marketplace, INDEX_KEY) == [(10, 1), (30, 3)]
+
+    marketplace._index_remove(Bytes(INDEX_KEY), entry(10, 1))
+    marketplace._index_remove(Bytes(INDEX_KEY), entry(30, 3))
+    assert not context.ledger.box_exists(marketplace, INDEX_KEY)
+
+
+def test_full_index_evicts_highest_entry(context: AlgopyTestContext, marketplace: CarbonMarketplace) -> None:
+    for listing_id in range(1, INDEX_CAPACITY + 1):
+        marketplace._index_insert(Bytes(INDEX_KEY), entry(100 + listing_id, listing_id))
+
+    # Sorts last: dropped
+    marketplace._index_insert(Bytes(INDEX_KEY), entry(10_000, 999))
+    entries = index_entries(context, marketplace, INDEX_KEY)
+    assert len(entries) == INDEX_CAPACITY
+    assert (10_000, 999) not in entries
+
+    # Sorts first: kept, and the highest entry falls off the end
+    marketplace._index_insert(Bytes(INDEX_KEY), entry(1, 998))
+    entries = index_entries(context, marketplace, INDEX_KEY)
+    assert len(entries) == INDEX_CAPACITY
+    assert entries[0] == (1, 998)
+    assert entries[-1] == (100 + INDEX_CAPACITY - 1, INDEX_CAPACITY - 1)
+
+    # Removing the evicted entry is a no-op
+    marketplace._index_remove(Bytes(INDEX_KEY), entry(100 + INDEX_CAPACITY, INDEX_CAPACITY))
+    assert len(index_entries(context, marketplace, INDEX_KEY)) == INDEX_CAPACITY
+
+
+# ─────────────────────────────────────────
+#  SWAP-REMOVE SETS
+# ─────────────────────────────────────────
+
+def test_active_set_remove_repoints_moved_listing(context: AlgopyTestContext, marketplace: CarbonMarketplace) -> None:
+    seller = context.any.account()
+    for listing_id in (1, 2, 3):
+        open_listing(marketplace, listing_id, seller, 10 * listing_id, 5)
+    assert [stored_listing(context, marketplace, i).list_slot.native for i in (1, 2, 3)] == [0, 1, 2]
+
+    # Listing 3 moves from the last slot into listing 1's slot
+    marketplace._active_set_remove(UInt64(0))
+    page = context.ledger.get_box(marketplace, ACTIVE_PAGE_PREFIX + (0).to_bytes(8, "big"))
+    assert page == (3).to_bytes(8, "big") + (2).to_bytes(8, "big")
+    assert stored_listing(context, marketplace, 3).list_slot.native == 0
+    assert marketplace.active_listing_count.value == 2
+
+
+def test_seller_index_remove_repoints_moved_listing(context: AlgopyTestContext, marketplace: CarbonMarketplace) -> None:
+    seller = context.any.account()
+    key    = SELLER_INDEX_PREFIX + seller.bytes.value
+    for listing_id in (1, 2, 3):
+        open_listing(marketplace, listing_id, seller, 10 * listing_id, 5)
+
+    marketplace._seller_index_remove(seller, UInt64(1))
+    assert context.ledger.get_box(marketplace, key) == (1).to_bytes(8, "big") + (3).to_bytes(8, "big")
+    assert stored_listing(context, marketplace, 3).seller_slot.native == 1
+
+    marketplace._seller_index_remove(seller, UInt64(1))
+    marketplace._seller_index_remove(seller, UInt64(0))
+    assert not context.ledger.box_exists(marketplace, key)
+
+
+# ─────────────────────────────────────────
+#  FILLS
+# ─────────────────────────────────────────
+
+def test_partial_fill_keeps_listing_open(context: AlgopyTestContext, marketplace: CarbonMarketplace) -> None:
+    seller = context.any.account()
+    open_listing(marketplace, 1, seller, 50, 10)
+
+    asset_id, paid_to, cost = marketplace._take_listing(UInt64(1), UInt64(4))
+
+    assert (asset_id, paid_to, cost) == (1001, seller, 200)
+    assert stored_listing(context, marketplace, 1).quantity.native == 6
+    assert index_entries(context, marketplace, MARKET_INDEX) == [(50, 1)]
+
+    depth = MarketDepth.from_bytes(context.ledger.get_box(marketplace, MARKET_DEPTH))
+    assert depth.active_listings.native == 1
+    assert depth.kg_on_offer.native == 6 * 1000
+    assert depth.trade_count.native == 1
+
+
+def test_full_fill_closes_listing_and_refunds_deposit(context: AlgopyTestContext, marketplace: CarbonMarketplace) -> None:
+    seller = context.any.account()
+    open_listing(marketplace, 1, seller, 50, 10)
+    open_listing(marketplace, 2, seller, 60, 10)
+
+    marketplace._take_listing(UInt64(1), UInt64(4))
+    marketplace._take_listing(UInt64(1), UInt64(6))
+
+    assert not context.ledger.box_exists(marketplace, LISTING_PREFIX + (1).to_bytes(8, "big"))
+    assert index_entries(context, marketplace, MARKET_INDEX) == [(60, 2)]
+    assert marketplace.active_listing_count.value == 1
+    assert stored_listing(context, marketplace, 2).list_slot.native == 0
+    assert stored_listing(context, marketplace, 2).seller_slot.native == 0
+
+    proceeds = context.ledger.get_box(marketplace, PROCEEDS_PREFIX + seller.bytes.value)
+    assert int.from_bytes(proceeds, "big") == marketplace._listing_deposit()
+
+    depth = MarketDepth.from_bytes(context.ledger.get_box(marketplace, MARKET_DEPTH))
+    assert depth.active_listings.native == 1
+    assert depth.kg_on_offer.native == 10 * 1000
+
+
+def test_listing_box_size_matches_layout(marketplace: CarbonMarketplace) -> None:
+    listing = open_listing(marketplace, 1, Account(), 50, 10)
+    assert len(listing.bytes) == LISTING_SIZE